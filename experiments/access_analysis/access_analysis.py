@@ -1,14 +1,25 @@
-from .algorithms_modified import proxy_problem_with_access_tracking
-import matplotlib.pyplot as plt
+from proxy_problem.proxy_smawk_with_lookup import proxy_problem
+from smawk.smawk_probe import SmawkProbe
 import numpy as np
 import random
 
+def proxy_problem_with_access_tracking(n, m, weights, distances):
+    # Accesses to the matrix of every DP layer, each layer is one top-level SMAWK search
+    probe = SmawkProbe(track_accesses=True)
+    proxy_problem(n, m, weights, distances, probe)
+
+    unique_access = len(probe.accesses)
+    total_access = sum(probe.accesses.values())
+    return unique_access, total_access
+
 def generate_random_data(n):
     distances = [random.randint(1, 100) for _ in range(n)] 
     weights = [random.randint(1, 100) for _ in range(n)]
     return distances, weights
 
 def compare_access_patterns():
+    import matplotlib.pyplot as plt # only needed for the plot
+
     n_values = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120, 130, 140, 150]  
     m = 10
     distances, weights = generate_random_data(max(n_values))
@@ -49,5 +60,6 @@ def compare_access_patterns():
     plt.savefig("experiments/results/access_analysis.pdf", dpi=1000, bbox_inches="tight")
     plt.show()
 
-# Run experiment
-compare_access_patterns()
\ No newline at end of file
+if __name__ == "__main__":
+    # Run experiment
+    compare_access_patterns()
\ No newline at end of file
@@ -0,0 +1,151 @@
+from proxy_problem.proxy_unoptimized import proxy_problem_unoptimized
+from proxy_problem.proxy_smawk_with_lookup import proxy_problem, proxy_problem_vectorized
+from proxy_problem.proxy_explicit_matrix import proxy_problem_explicit_matrix
+from proxy_problem.proxy_lagrangian import proxy_problem_lagrangian
+from proxy_problem.proxy_divide_conquer import proxy_problem_divide_conquer
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import numpy as np
+
+# (name, algorithm, largest n it is run for)
+ALGORITHMS = [
+    ("Unoptimized DP", proxy_problem_unoptimized, 400),
+    ("SMAWK with Lookup", proxy_problem, None),
+    ("Vectorized SMAWK", proxy_problem_vectorized, None),
+    ("Explicit-Matrix SMAWK", proxy_problem_explicit_matrix, 400),
+    ("Lagrangian", proxy_problem_lagrangian, None),
+    ("Divide and Conquer", proxy_problem_divide_conquer, None),
+]
+
+def generate_random_data(n, seed):
+    rng = random.Random(seed)
+    distances = [rng.randint(1, 100) for _ in range(n)]
+    weights = [rng.randint(1, 100) for _ in range(n)]
+    return distances, weights
+
+def measure_runtime(algorithm, n, m, weights, distances, warmup, repetitions):
+    for _ in range(warmup):
+        result = algorithm(n, m, weights, distances)
+
+    runtimes = []
+    for _ in range(repetitions):
+        start_time = time.perf_counter()
+        result = algorithm(n, m, weights, distances)
+        runtimes.append(time.perf_counter() - start_time)
+
+    q1, median, q3 = (float(q) for q in np.percentile(runtimes, [25, 50, 75]))
+    statistics = {
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "min": min(runtimes),
+        "repetitions": repetitions,
+    }
+    return statistics, result
+
+def fit_scaling_exponent(n_values, runtimes):
+    # Slope of the least-squares line through (log n, log runtime)
+    if len(n_values) < 2:
+        return None
+    slope, _ = np.polyfit(np.log(n_values), np.log(runtimes), 1)
+    return float(slope)
+
+def run_benchmark(n_values, m_values, algorithms, warmup, repetitions, seed):
+    results = []
+    for n in n_values:
+        distances, weights = generate_random_data(n, seed + n)
+        for m in m_values:
+            outputs = []
+            for name, algorithm, max_n in algorithms:
+                if max_n is not None and n > max_n:
+                    continue
+                statistics, output = measure_runtime(algorithm, n, m, weights, distances, warmup, repetitions)
+                results.append({"algorithm": name, "n": n, "m": m, **statistics})
+                outputs.append(output)
+                print(f"{name:>22} n={n:<6} m={m:<4} median {statistics['median']:.6f}s  IQR {statistics['iqr']:.6f}s", file=sys.stderr)
+
+            # Ensure algorithms produce the same results
+            assert all(output == outputs[0] for output in outputs), f"Results mismatch for n={n}, m={m}"
+
+    # Empirical scaling exponent in n per algorithm and m
+    scaling = {}
+    for name, _, _ in algorithms:
+        for m in m_values:
+            rows = [row for row in results if row["algorithm"] == name and row["m"] == m]
+            exponent = fit_scaling_exponent([row["n"] for row in rows], [row["median"] for row in rows])
+            scaling.setdefault(name, {})[str(m)] = exponent
+
+    return results, scaling
+
+def compare_with_baseline(results, baseline, tolerance):
+    # Entries whose median exceeds the baseline median by more than the tolerance
+    reference = {(row["algorithm"], row["n"], row["m"]): row for row in baseline["results"]}
+    regressions = []
+    for row in results:
+        previous = reference.get((row["algorithm"], row["n"], row["m"]))
+        if previous is None:
+            continue
+        ratio = row["median"] / previous["median"]
+        if ratio > 1 + tolerance:
+            regressions.append({"algorithm": row["algorithm"], "n": row["n"], "m": row["m"],
+                                "median": row["median"], "baseline_median": previous["median"], "ratio": ratio})
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the proxy problem solvers.")
+    parser.add_argument("--n", type=int, nargs="+", default=[100, 200, 400, 800, 1600], help="Numbers of nodes")
+    parser.add_argument("--m", type=int, nargs="+", default=[2, 10], help="Numbers of proxies")
+    parser.add_argument("--algorithms", nargs="+", help="Names of the algorithms to run (default: all)")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per measurement")
+    parser.add_argument("--repetitions", type=int, default=7, help="Timed runs per measurement")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random inputs")
+    parser.add_argument("--output", default="experiments/results/benchmark.json", help="JSON file for the results")
+    parser.add_argument("--baseline", help="JSON file of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown of the median")
+    args = parser.parse_args(argv)
+
+    algorithms = ALGORITHMS
+    if args.algorithms:
+        unknown = set(args.algorithms) - {name for name, _, _ in ALGORITHMS}
+        if unknown:
+            parser.error(f"unknown algorithms: {', '.join(sorted(unknown))}")
+        algorithms = [entry for entry in ALGORITHMS if entry[0] in args.algorithms]
+
+    results, scaling = run_benchmark(sorted(args.n), sorted(args.m), algorithms, args.warmup, args.repetitions, args.seed)
+
+    report = {
+        "config": {"n": sorted(args.n), "m": sorted(args.m), "warmup": args.warmup,
+                   "repetitions": args.repetitions, "seed": args.seed},
+        "environment": {"python": platform.python_version(), "numpy": np.__version__,
+                        "machine": platform.machine(), "platform": platform.platform()},
+        "results": results,
+        "scaling": scaling,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        report["regressions"] = regressions
+
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    for name, exponents in scaling.items():
+        fitted = ", ".join(f"m={m}: n^{exponent:.2f}" for m, exponent in exponents.items() if exponent is not None)
+        print(f"{name:>22}  {fitted}")
+
+    for regression in regressions:
+        print(f"Regression: {regression['algorithm']} n={regression['n']} m={regression['m']} "
+              f"{regression['median']:.6f}s vs {regression['baseline_median']:.6f}s ({regression['ratio']:.2f}x)")
+
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,17 @@
-import matplotlib.pyplot as plt
 import random
-from .algorithms_modified import proxy_problem_unoptimized, proxy_problem
+from proxy_problem.proxy_unoptimized import proxy_problem_unoptimized
+from proxy_problem.proxy_smawk_with_lookup import proxy_problem
+from smawk.smawk_probe import SmawkProbe
+
+def count_unoptimized(n, m, weights, distances):
+    # Each of the m layers compares all i < j for every node j >= 2
+    return proxy_problem_unoptimized(n, m, weights, distances), m * n * (n+1) // 2
+
+def count_smawk(n, m, weights, distances):
+    # Comparisons of all phases (reduce, interpolate, base case) over all SMAWK searches
+    probe = SmawkProbe()
+    result = proxy_problem(n, m, weights, distances, probe)
+    return result, sum(probe.comparisons.values())
 
 def measure_comparisons(algorithm, n, m, weights, distances):
     result, comparison_count = algorithm(n, m, weights, distances)
@@ -12,14 +23,16 @@ def generate_random_data(n):
     return distances, weights
 
 def compare_algorithms():
+    import matplotlib.pyplot as plt # only needed for the plot
+
     n_values = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120, 130, 140, 150]  
     m = 10
     distances, weights = generate_random_data(max(n_values))
 
     # Define algorithms to compare
     algorithms = [
-        ("Unoptimized DP", proxy_problem_unoptimized),
-        ("SMAWK with Lookup", proxy_problem)
+        ("Unoptimized DP", count_unoptimized),
+        ("SMAWK with Lookup", count_smawk)
     ]
     
     comparisons = {name: [] for name, _ in algorithms}
@@ -59,5 +72,6 @@ def compare_algorithms():
     plt.savefig("experiments/results/comparison_counts.pdf", dpi=1000, bbox_inches="tight")
     plt.show()
 
-# Run experiment
-compare_algorithms()
+if __name__ == "__main__":
+    # Run experiment
+    compare_algorithms()
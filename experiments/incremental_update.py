@@ -0,0 +1,58 @@
+from proxy_problem.proxy_smawk_with_lookup import proxy_problem
+from proxy_problem.proxy_incremental import IncrementalProxySolver
+import time
+import random
+
+def generate_random_data(n):
+    distances = [random.randint(1, 100) for _ in range(n)]
+    weights = [random.randint(1, 100) for _ in range(n)]
+    return distances, weights
+
+def measure_update_latency(solver, update, values, position, repetitions):
+    # Median time of a single update of values[position] followed by a re-solve,
+    # `update` is solver.update_weight or solver.update_distance
+    latencies = []
+    for _ in range(repetitions):
+        values[position] = random.randint(1, 100)
+        start_time = time.perf_counter()
+        update(position, values[position])
+        result = solver.solve()
+        latencies.append(time.perf_counter() - start_time)
+    latencies.sort()
+    return latencies[len(latencies) // 2], result
+
+def compare_update_latency():
+    n_values = [250, 500, 1000, 2000, 4000]
+    m = 10
+    repetitions = 5
+    distances, weights = generate_random_data(max(n_values))
+
+    print(f"{'n':>6} {'full re-solve':>14} {'update at 50%':>14} {'update at 90%':>14} {'update at 99%':>14} {'distance at 50%':>16}")
+    for n in n_values:
+        d_sub = distances[:n]
+        w_sub = weights[:n]
+
+        start_time = time.perf_counter()
+        proxy_problem(n, m, w_sub, d_sub)
+        full_time = time.perf_counter() - start_time
+
+        solver = IncrementalProxySolver(n, m, w_sub, d_sub)
+        solver.solve()
+
+        update_times = []
+        for fraction in (0.5, 0.9, 0.99):
+            update_time, result = measure_update_latency(solver, solver.update_weight, w_sub, int(fraction * (n-1)), repetitions)
+            update_times.append(update_time)
+
+            # Ensure the incremental solver agrees with a full re-solve
+            assert result == proxy_problem(n, m, w_sub, d_sub), f"Results mismatch for n={n}"
+
+        # A distance edit shifts the positions of all later nodes, not only their weights
+        distance_time, result = measure_update_latency(solver, solver.update_distance, d_sub, int(0.5 * (n-1)), repetitions)
+        assert result == proxy_problem(n, m, w_sub, d_sub), f"Results mismatch for n={n} after a distance update"
+
+        print(f"{n:>6} {full_time:>13.4f}s " + " ".join(f"{t:>13.4f}s" for t in update_times) + f" {distance_time:>15.4f}s")
+
+if __name__ == "__main__":
+    # Run experiment
+    compare_update_latency()
@@ -0,0 +1,116 @@
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import mmap
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import numpy as np
+from smawk.smawk_explicit_matrix import smawk
+
+def generate_monge_matrix(path, num_rows, num_columns, seed, block_rows=256):
+    # (x_i - y_j)^2 + f(i) + g(j) with sorted x and y is Monge, written in blocks of rows
+    rng = np.random.default_rng(seed)
+    x = np.sort(rng.random(num_rows))
+    y = np.sort(rng.random(num_columns))
+    f = rng.random(num_rows)
+    g = rng.random(num_columns)
+
+    matrix = np.memmap(path, dtype=np.float64, mode="w+", shape=(num_rows, num_columns))
+    for start in range(0, num_rows, block_rows):
+        stop = min(start + block_rows, num_rows)
+        matrix[start:stop] = (x[start:stop, None] - y[None, :]) ** 2 + f[start:stop, None] + g[None, :]
+    matrix.flush()
+    del matrix
+
+def drop_from_page_cache(path):
+    # Written pages are clean after the fsync, so the kernel can drop them without root
+    with open(path, "rb+") as file:
+        os.fsync(file.fileno())
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+def read_bytes():
+    # Bytes this process caused to be read from storage, None where /proc is not available
+    try:
+        with open("/proc/self/io") as file:
+            for line in file:
+                if line.startswith("read_bytes:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+
+def measure(mode, path, num_rows, num_columns):
+    # Runs in a fresh worker process so that its counters only see this search
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    bytes_before = read_bytes()
+    start_time = time.perf_counter()
+
+    if mode == "memmap":
+        matrix = np.memmap(path, dtype=np.float64, mode="r", shape=(num_rows, num_columns))
+    elif mode == "mmap-random":
+        # Without read-ahead every page fault reads a single page
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        mapping.madvise(mmap.MADV_RANDOM)
+        matrix = np.frombuffer(mapping, dtype=np.float64).reshape(num_rows, num_columns)
+    else:
+        matrix = np.fromfile(path, dtype=np.float64).reshape(num_rows, num_columns)
+    minima = smawk(matrix)
+
+    seconds = time.perf_counter() - start_time
+    after = resource.getrusage(resource.RUSAGE_SELF)
+    bytes_after = read_bytes()
+    return minima, {
+        "seconds": seconds,
+        "major_faults": after.ru_majflt - usage.ru_majflt,
+        "minor_faults": after.ru_minflt - usage.ru_minflt,
+        "read_bytes": None if bytes_before is None else bytes_after - bytes_before,
+        "max_rss_kib": after.ru_maxrss,
+    }
+
+# Full load with np.fromfile, np.memmap with the read-ahead of the kernel, and a
+# memory map advised as random access
+MODES = ("load", "memmap", "mmap-random")
+
+def compare_out_of_core(num_rows, num_columns, seed, directory):
+    with tempfile.TemporaryDirectory(dir=directory) as directory:
+        path = os.path.join(directory, "matrix.f64")
+        context = multiprocessing.get_context("spawn")
+
+        # Every step runs in a fresh process, since the peak RSS is inherited by child processes
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            executor.submit(generate_monge_matrix, path, num_rows, num_columns, seed).result()
+        size = os.path.getsize(path)
+        print(f"Matrix of {num_rows} x {num_columns} doubles, {size / 2**20:.1f} MiB on disk")
+
+        results = {}
+        for mode in MODES:
+            drop_from_page_cache(path)
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results[mode] = executor.submit(measure, mode, path, num_rows, num_columns).result()
+
+        for mode in MODES[1:]:
+            assert results[mode][0] == results["load"][0], f"Row minima differ between {mode} and full load"
+
+        print(f"{'mode':>11} {'time':>9} {'major faults':>13} {'minor faults':>13} {'read MiB':>9} {'max RSS MiB':>12}")
+        for mode, (_, stats) in results.items():
+            read = "n/a" if stats["read_bytes"] is None else f"{stats['read_bytes'] / 2**20:.1f}"
+            print(f"{mode:>11} {stats['seconds']:>8.3f}s {stats['major_faults']:>13} {stats['minor_faults']:>13} "
+                  f"{read:>9} {stats['max_rss_kib'] / 2**10:>12.1f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare SMAWK on a memory-mapped matrix with loading it fully.")
+    parser.add_argument("--rows", type=int, default=8192, help="Number of rows of the matrix")
+    parser.add_argument("--columns", type=int, default=8192, help="Number of columns of the matrix")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random matrix")
+    parser.add_argument("--dir", help="Directory of the temporary matrix file (default: system temp directory)")
+    args = parser.parse_args(argv)
+
+    compare_out_of_core(args.rows, args.columns, args.seed, args.dir)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
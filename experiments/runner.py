@@ -0,0 +1,180 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from experiments.benchmark import ALGORITHMS
+from experiments.comparison_counts.comparison_counts import count_unoptimized, count_smawk
+from experiments.access_analysis.access_analysis import proxy_problem_with_access_tracking
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import numpy as np
+
+# Each measurement maps (algorithm, n, m, weights, distances) to the recorded metrics
+def measure_runtime(algorithm, n, m, weights, distances):
+    start_time = time.perf_counter()
+    result = algorithm(n, m, weights, distances)
+    return {"result": result, "seconds": time.perf_counter() - start_time}
+
+def measure_comparisons(algorithm, n, m, weights, distances):
+    result, comparison_count = algorithm(n, m, weights, distances)
+    return {"result": result, "comparisons": comparison_count}
+
+def measure_accesses(algorithm, n, m, weights, distances):
+    unique_access, total_access = algorithm(n, m, weights, distances)
+    return {"unique_accesses": unique_access, "total_accesses": total_access, "full_size": m * (n+2) * (n+1)}
+
+# Experiment -> (measurement, plotted metric, [(algorithm name, algorithm, largest n it is run for)])
+EXPERIMENTS = {
+    "runtime": (measure_runtime, "seconds", ALGORITHMS),
+    "comparisons": (measure_comparisons, "comparisons", [
+        ("Unoptimized DP", count_unoptimized, 2000),
+        ("SMAWK with Lookup", count_smawk, None),
+    ]),
+    "accesses": (measure_accesses, "unique_accesses", [
+        ("SMAWK with Lookup", proxy_problem_with_access_tracking, None),
+    ]),
+}
+
+def generate_random_data(n, seed):
+    rng = random.Random(seed * 1000003 + n)
+    distances = [rng.randint(1, 100) for _ in range(n)]
+    weights = [rng.randint(1, 100) for _ in range(n)]
+    return distances, weights
+
+def cell_key(record):
+    return (record["experiment"], record["algorithm"], record["n"], record["m"], record["seed"])
+
+def run_cell(experiment, algorithm, n, m, seed):
+    measure, _, algorithms = EXPERIMENTS[experiment]
+    function = next(function for name, function, _ in algorithms if name == algorithm)
+    distances, weights = generate_random_data(n, seed)
+    metrics = measure(function, n, m, weights, distances)
+    return {"experiment": experiment, "algorithm": algorithm, "n": n, "m": m, "seed": seed, **metrics}
+
+def load_store(path):
+    # Records of completed cells, a line cut off by a crash is ignored
+    records = []
+    if not os.path.exists(path):
+        return records
+    with open(path) as file:
+        for line in file:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+def run(store, experiment, n_values, m_values, seeds, algorithm_names, workers):
+    _, _, algorithms = EXPERIMENTS[experiment]
+    if algorithm_names:
+        algorithms = [entry for entry in algorithms if entry[0] in algorithm_names]
+
+    grid = [(experiment, name, n, m, seed)
+            for n in n_values for m in m_values for seed in seeds
+            for name, _, max_n in algorithms if max_n is None or n <= max_n]
+    completed = {cell_key(record) for record in load_store(store)}
+    cells = [cell for cell in grid if cell not in completed]
+    print(f"{len(cells)} of {len(grid)} cells to run, the others are in {store}", file=sys.stderr)
+
+    # Largest cells first so that the pool does not wait on one straggler at the end
+    cells.sort(key=lambda cell: -cell[2] * (cell[3] + 1))
+
+    os.makedirs(os.path.dirname(store) or ".", exist_ok=True)
+    failures = 0
+    with open(store, "a+") as file, ProcessPoolExecutor(max_workers=workers) as executor:
+        # Terminate a line cut off by a crash so that it does not swallow the next record
+        if file.tell() > 0:
+            file.seek(file.tell() - 1)
+            if file.read(1) != "\n":
+                file.write("\n")
+
+        futures = {executor.submit(run_cell, *cell): cell for cell in cells}
+        for done, future in enumerate(as_completed(futures), 1):
+            cell = futures[future]
+            try:
+                record = future.result()
+            except Exception as error:
+                failures += 1
+                print(f"[{done}/{len(cells)}] {cell} failed: {error!r}", file=sys.stderr)
+                continue
+
+            # Every completed cell is on disk before the next one is reported
+            file.write(json.dumps(record) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+            print(f"[{done}/{len(cells)}] {cell}", file=sys.stderr)
+
+    return 1 if failures else 0
+
+def plot(store, output_dir):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    records = load_store(store)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Median over the seeds of every (experiment, m, algorithm, n)
+    grouped = {}
+    for record in records:
+        metric = EXPERIMENTS[record["experiment"]][1]
+        key = (record["experiment"], record["m"])
+        grouped.setdefault(key, {}).setdefault(record["algorithm"], {}).setdefault(record["n"], []).append(record[metric])
+
+    plt.rcParams["font.family"] = "STIXGeneral"
+    plt.rcParams["legend.fontsize"] = 20
+    plt.rcParams["axes.labelsize"] = 22
+    plt.rcParams["xtick.labelsize"] = 18
+    plt.rcParams["ytick.labelsize"] = 18
+
+    labels = {"seconds": "Runtime (Seconds)", "comparisons": "Comparison Count", "unique_accesses": "Unique Accessed Entries"}
+    paths = []
+    for (experiment, m), series in sorted(grouped.items()):
+        metric = EXPERIMENTS[experiment][1]
+        plt.figure(figsize=(8, 6))
+        for algorithm, values in sorted(series.items()):
+            n_values = sorted(values)
+            plt.plot(n_values, [np.median(values[n]) for n in n_values], label=algorithm, marker="o", markersize=6)
+
+        plt.xscale("log")
+        plt.yscale("log")
+        plt.xlabel("n (Number of Nodes)")
+        plt.ylabel(labels[metric])
+        plt.title(f"m = {m}")
+        plt.legend(loc="upper left", fontsize=20, frameon=True)
+        plt.grid(color="#808080", linestyle="--", linewidth=0.5)
+        plt.tight_layout()
+
+        path = os.path.join(output_dir, f"{experiment}_m{m}.pdf")
+        plt.savefig(path, dpi=1000, bbox_inches="tight")
+        plt.close()
+        paths.append(path)
+
+    for path in paths:
+        print(path)
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the experiment grid in parallel and plot from the stored results.")
+    parser.add_argument("--store", default="experiments/results/runs.jsonl", help="JSON-lines file of completed cells")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run all cells of the grid that are not in the store yet")
+    run_parser.add_argument("experiment", choices=sorted(EXPERIMENTS))
+    run_parser.add_argument("--n", type=int, nargs="+", default=[1000, 10000, 100000], help="Numbers of nodes")
+    run_parser.add_argument("--m", type=int, nargs="+", default=[2, 10], help="Numbers of proxies")
+    run_parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2], help="Seeds of the random inputs")
+    run_parser.add_argument("--algorithms", nargs="+", help="Names of the algorithms to run (default: all)")
+    run_parser.add_argument("--workers", type=int, help="Number of worker processes (default: CPU count)")
+
+    plot_parser = commands.add_parser("plot", help="Plot the stored results")
+    plot_parser.add_argument("--output-dir", default="experiments/results", help="Directory of the plots")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return run(args.store, args.experiment, args.n, args.m, args.seeds, args.algorithms, args.workers)
+    return plot(args.store, args.output_dir)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,16 @@
 from proxy_problem.proxy_unoptimized import proxy_problem_unoptimized
-from proxy_problem.proxy_smawk_with_lookup import proxy_problem
+from proxy_problem.proxy_smawk_with_lookup import proxy_problem, proxy_problem_vectorized
 from proxy_problem.proxy_explicit_matrix import proxy_problem_explicit_matrix
+from proxy_problem.proxy_lagrangian import proxy_problem_lagrangian
+from proxy_problem.proxy_divide_conquer import proxy_problem_divide_conquer
 import time
-import matplotlib.pyplot as plt
 import random
 import numpy as np
 
 def measure_runtime(algorithm, n, m, weights, distances):
-    start_time = time.time()
+    start_time = time.perf_counter()
     result = algorithm(n, m, weights, distances)
-    end_time = time.time()
+    end_time = time.perf_counter()
     return end_time - start_time, result
 
 def generate_random_data(n):
@@ -18,6 +19,8 @@ def generate_random_data(n):
     return distances, weights
 
 def compare_algorithms():
+    import matplotlib.pyplot as plt # only needed for the plot
+
     n_values = np.array([10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120, 130, 140, 150])
     m = 10
     distances, weights = generate_random_data(max(n_values))
@@ -26,7 +29,9 @@ def compare_algorithms():
     algorithms = [
         ("Unoptimized DP", proxy_problem_unoptimized),
         ("SMAWK with Lookup", proxy_problem),
-        ("Explicit-Matrix SMAWK", proxy_problem_explicit_matrix)
+        ("Explicit-Matrix SMAWK", proxy_problem_explicit_matrix),
+        ("Lagrangian", proxy_problem_lagrangian),
+        ("Divide and Conquer", proxy_problem_divide_conquer)
     ]
 
     times = {name: [] for name, _ in algorithms} # Dictionary to store measured runtimes per algorithm
@@ -38,7 +43,7 @@ def compare_algorithms():
             times[name].append(runtime)
             results.append(result)
         
-        # Ensure algorithms produce the same results
+        # Ensure algorithms produce the same results (cross-checks the Lagrangian solver against proxy_problem)
         assert all(r == results[0] for r in results), f"Results mismatch for n={n}" 
     
     # Extract runtimes as arrays
@@ -66,6 +71,8 @@ def compare_algorithms():
     plt.plot(n_values, times["Unoptimized DP"], label="Unoptimized DP", color="#333333", marker="o", markersize=6)
     plt.plot(n_values, times["SMAWK with Lookup"], label="SMAWK with Lookup", color="#007acc", marker="s", markersize=6)
     plt.plot(n_values, times["Explicit-Matrix SMAWK"], label="Explicit-Matrix SMAWK", color="#1f4e79", marker="D", markersize=6)
+    plt.plot(n_values, times["Lagrangian"], label="Lagrangian", color="#e69f00", marker="^", markersize=6)
+    plt.plot(n_values, times["Divide and Conquer"], label="Divide and Conquer", color="#009e73", marker="v", markersize=6)
 
     plt.plot(n_values, theoretical_n2m, label="$\mathcal{O}(m n^2)$", color="red", linestyle="dashed")
     plt.plot(n_values, theoretical_mn, label="$\mathcal{O}(m n)$", color="green", linestyle="dashed")
@@ -80,5 +87,54 @@ def compare_algorithms():
 
     plt.show()
 
-# Run experiment
-compare_algorithms()
+# Engines timed at realistic n, with the largest n each one is run for
+LARGE_N_ALGORITHMS = [
+    ("Unoptimized DP", proxy_problem_unoptimized, 1000),
+    ("SMAWK with Lookup", proxy_problem, None),
+    ("Vectorized SMAWK", proxy_problem_vectorized, None),
+    ("Explicit-Matrix SMAWK", proxy_problem_explicit_matrix, 1000),
+    ("Lagrangian", proxy_problem_lagrangian, 10000),
+    ("Divide and Conquer", proxy_problem_divide_conquer, None),
+]
+
+def compare_algorithms_large_n():
+    import matplotlib.pyplot as plt # only needed for the plot
+
+    # The O(mn^2) engines are capped, so the fast engines can be compared where they differ
+    n_values = [1000, 3000, 10000, 30000, 100000]
+    m = 10
+    distances, weights = generate_random_data(max(n_values))
+
+    times = {name: [] for name, _, _ in LARGE_N_ALGORITHMS}
+    for n in n_values:
+        results = []
+        for name, algorithm, max_n in LARGE_N_ALGORITHMS:
+            if max_n is not None and n > max_n:
+                continue
+            runtime, result = measure_runtime(algorithm, n, m, weights, distances)
+            times[name].append(runtime)
+            results.append(result)
+            print(f"n={n:>6} {name:>22} {runtime:>9.3f}s")
+
+        assert all(r == results[0] for r in results), f"Results mismatch for n={n}"
+
+    plt.figure(figsize=(8, 6))
+    for (name, _, _), marker in zip(LARGE_N_ALGORITHMS, "osxD^v"):
+        plt.plot(n_values[:len(times[name])], times[name], label=name, marker=marker, markersize=6)
+
+    plt.xscale("log")
+    plt.yscale("log")
+    plt.xlabel("n (Number of Nodes)")
+    plt.ylabel("Runtime (Seconds)")
+
+    plt.legend(loc="upper left", frameon=True)
+    plt.grid(color="#808080", linestyle="--", linewidth=0.5)
+    plt.tight_layout()
+    plt.savefig("experiments/results/runtime_analysis_large_n.pdf", dpi=1000, bbox_inches="tight")
+
+    plt.show()
+
+if __name__ == "__main__":
+    # Run experiments
+    compare_algorithms()
+    compare_algorithms_large_n()
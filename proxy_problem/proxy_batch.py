@@ -0,0 +1,139 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import os
+import numpy as np
+from proxy_problem.proxy_smawk_with_lookup import proxy_problem
+
+# View of n int64 values at a byte offset of a shared memory block, nothing is copied
+def _shared_view(block, offset, length):
+    return np.ndarray((length,), dtype=np.int64, buffer=block.buf, offset=offset)
+
+# Weights and distances as arrays if both are exactly representable as int64, else None
+def _int64_arrays(n, weights, distances):
+    weights = np.asarray(weights[:n])
+    distances = np.asarray(distances[:n])
+    if not (np.can_cast(weights.dtype, np.int64) and np.can_cast(distances.dtype, np.int64)):
+        return None
+    return weights, distances
+
+def _solve_chunk(solver, tasks, block_name):
+    block = shared_memory.SharedMemory(name=block_name) if block_name else None
+    weights = distances = None
+    try:
+        results = []
+        for index, n, m, weights, distances in tasks:
+            # Large inputs are passed as (offset, length) references into the shared block
+            if isinstance(weights, tuple):
+                weights = _shared_view(block, *weights)
+                distances = _shared_view(block, *distances)
+            results.append((index, solver(n, m, weights, distances)))
+        return results
+    finally:
+        if block is not None:
+            del weights, distances # the views must be released before the block is closed
+            block.close()
+
+"""
+Solves many independent proxy instances on a process pool.
+
+Instances with at least `shared_threshold` nodes and integer inputs that fit int64 are copied
+once into a shared memory block that a worker attaches to for the chunks that need it, so their
+weights and distances are not pickled. The solver gets them as int64 NumPy views into the block,
+which `ProxyInstance` reads in place. Float or object inputs are pickled as given, so they
+are never truncated.
+Instances are grouped into chunks of roughly `chunk_work` estimated work (n * (m+1))
+so that small instances share one round trip to a worker.
+
+Parameters:
+    instances (List[Tuple[int, int, List[int], List[int]]]): (n, m, weights, distances) per instance
+    solver (Callable): Picklable proxy solver with the signature of `proxy_problem`, taking
+        lists and NumPy arrays as weights and distances
+    max_workers (int, optional): Number of worker processes, defaults to the CPU count
+    chunk_work (int, optional): Target work per chunk, defaults to an even split into
+        four chunks per worker
+    shared_threshold (int): Minimal n for passing an instance through shared memory
+
+Yields:
+    (int, int): The index of an instance in `instances` and its minimal total latency,
+                in order of completion
+"""
+def solve_batch(instances, solver=proxy_problem, max_workers=None, chunk_work=None, shared_threshold=10000):
+    instances = list(instances)
+    if not instances:
+        return
+    max_workers = max_workers or os.cpu_count() or 1
+
+    # Copy the arrays of large integer instances into one shared block
+    large = {}
+    for index, (n, _, weights, distances) in enumerate(instances):
+        if n >= shared_threshold:
+            arrays = _int64_arrays(n, weights, distances)
+            if arrays is not None:
+                large[index] = arrays
+    total_length = sum(2 * instances[index][0] for index in large)
+    block = shared_memory.SharedMemory(create=True, size=8 * total_length) if total_length else None
+
+    try:
+        references = {}
+        offset = 0
+        for index, (weights, distances) in large.items():
+            n = instances[index][0]
+            shared = np.ndarray((2 * n,), dtype=np.int64, buffer=block.buf, offset=offset)
+            shared[:n] = weights[:n]
+            shared[n:] = distances[:n]
+            references[index] = ((offset, n), (offset + 8 * n, n))
+            offset += 16 * n
+            del shared
+        del large # the converted arrays are not needed once copied
+
+        # Group instances into chunks of similar estimated work
+        work = [n * (m+1) for n, m, _, _ in instances]
+        if chunk_work is None:
+            chunk_work = max(1, sum(work) // (4 * max_workers))
+
+        chunks = [] # (tasks, name of the shared block if a task reads from it)
+        chunk = []
+        chunk_total = 0
+        shared = False
+        for index, (n, m, weights, distances) in enumerate(instances):
+            if index in references:
+                weights, distances = references[index]
+                shared = True
+            chunk.append((index, n, m, weights, distances))
+            chunk_total += work[index]
+            if chunk_total >= chunk_work:
+                chunks.append((chunk, block.name if shared else None))
+                chunk = []
+                chunk_total = 0
+                shared = False
+        if chunk:
+            chunks.append((chunk, block.name if shared else None))
+
+        # Stream results back as chunks complete
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_solve_chunk, solver, chunk, block_name) for chunk, block_name in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    finally:
+        if block is not None:
+            block.close()
+            block.unlink()
+
+
+if __name__ == "__main__":
+    import random
+
+    # Example values: many small and a few large random instances
+    instances = []
+    for n in [10] * 200 + [20000] * 2:
+        weights = [random.randint(1, 100) for _ in range(n)]
+        distances = [random.randint(1, 100) for _ in range(n)]
+        instances.append((n, 3, weights, distances))
+
+    latencies = [None] * len(instances)
+    for index, latency in solve_batch(instances):
+        latencies[index] = latency
+
+    print(f"Solved {len(instances)} instances")
+    print(f"Minimal total latency of the large instances: {latencies[-2:]}")
@@ -0,0 +1,215 @@
+import hashlib
+import os
+import tempfile
+import time
+import zipfile
+import numpy as np
+from smawk.monge_dp import monge_dp
+from proxy_problem.proxy_instance import ProxyInstance
+
+"""
+Persistent cache of proxy solves, addressed by the content of the instance.
+
+An instance is keyed by a blake2b digest of n and the dtypes and values of its weights and
+distances, so float instances never share an entry with truncated ones. Its entry is
+one uncompressed `.npz` file holding the largest number of proxies m solved for, the last
+DP layer F[.][m+1], the optimal predecessors of every layer as 4-byte integers for the
+placement and, if `store_curve` is set, the latency for every k = 0..m. A request for more
+proxies than stored continues the DP from the stored layer instead of starting again at
+k = 2, and replaces the entry.
+
+`solve(n, m, weights, distances)` returns the minimal total latency and the placement of
+the proxies like `proxy_problem_with_placement`, and with `return_curve` also the latency
+for every k = 0..m.
+
+Files are written to a temporary name and renamed, so concurrent processes can share a
+directory. Every hit refreshes the modification time of its file, and once the files exceed
+`max_bytes` the least recently used ones are deleted. Temporary files left behind by
+interrupted writes are deleted by the eviction after an hour.
+
+Parameters:
+    directory (str): Directory of the cache files, created if missing
+    max_bytes (int): Size cap of all cache files together
+    store_curve (bool): Also store the latency for every number of proxies, which answers
+        requests for fewer proxies than stored
+
+Attributes:
+    hits (int): Number of solves answered from the cache
+    resumes (int): Number of solves continued from a stored layer
+    misses (int): Number of solves started from scratch
+"""
+
+class ProxyCache:
+    def __init__(self, directory, max_bytes=2**30, store_curve=True):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.store_curve = store_curve
+        self.hits = 0
+        self.resumes = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    # Content digest of an instance
+    def key(self, n, weights, distances):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.int64(n).tobytes())
+        _update_digest(digest, np.asarray(weights)[:n])
+        _update_digest(digest, np.asarray(distances)[:n])
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    # Arrays of an entry, None if it is missing or unreadable
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with np.load(path) as entry:
+                arrays = {name: entry[name] for name in entry.files}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            os.remove(path) # left behind by a crash, solved again
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass # evicted by another process after it was read
+        return arrays
+
+    def _store(self, key, m, last, predecessors, curve):
+        arrays = {"m": np.int64(m), "last": np.asarray(last),
+                  "predecessors": np.asarray(predecessors, dtype=np.int32).reshape(m, len(last))}
+        if curve is not None:
+            arrays["curve"] = np.asarray(curve)
+
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as file:
+            np.savez(file, **arrays)
+        os.replace(file.name, self._path(key))
+        self._evict(keep=self._path(key))
+
+    # Deletes the least recently used entries until the cache fits into max_bytes, and the
+    # temporary files of writes that were interrupted more than stale_seconds ago
+    def _evict(self, keep, stale_seconds=3600):
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith((".npz", ".tmp")):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                status = os.stat(path)
+                if name.endswith(".tmp"):
+                    if now - status.st_mtime > stale_seconds:
+                        os.remove(path)
+                    continue
+            except FileNotFoundError:
+                continue # evicted or renamed by another process
+            entries.append((status.st_mtime, status.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    # Minimal total latency and placement of m proxies, answered from the cache where possible
+    def solve(self, n, m, weights, distances, return_curve=False):
+        key = self.key(n, weights, distances)
+        entry = self._load(key)
+        stored = -1 if entry is None else int(entry["m"])
+        has_curve = entry is not None and "curve" in entry
+
+        # Hit: the stored solve covers m, fewer proxies are answered from the curve
+        if (stored == m and (has_curve or not return_curve)) or (stored > m and has_curve):
+            self.hits += 1
+            curve = entry["curve"].tolist()[:m+1] if has_curve else None
+            latency = curve[m] if has_curve else entry["last"][n+1].item()
+            placement = _placement(entry["predecessors"][:m], n)
+            return (latency, placement, curve) if return_curve else (latency, placement)
+
+        instance = ProxyInstance(n, weights, distances)
+
+        # Resume from the stored layer F[.][stored+1], or start with the base cases
+        if 0 <= stored < m and (has_curve or not (return_curve or self.store_curve)):
+            self.resumes += 1
+            initial = entry["last"].tolist()
+            predecessors = list(entry["predecessors"])
+            curve = entry["curve"].tolist() if has_curve else None
+        else:
+            self.misses += 1
+            stored = 0
+            initial = [instance.cost(0, j) for j in range(n+2)]
+            initial[1] = 0
+            predecessors = []
+            curve = [initial[n+1]]
+
+        layers, argmins = monge_dp(n+2, m - stored, initial, instance.cost, cumulative=True)
+        predecessors.extend(argmins)
+        if curve is not None:
+            curve.extend(layer[n+1] for layer in layers[1:])
+
+        # Never replace an entry for more proxies
+        if entry is None or int(entry["m"]) < m:
+            self._store(key, m, layers[-1], predecessors, curve if self.store_curve else None)
+
+        latency = layers[-1][n+1]
+        placement = _placement(predecessors, n)
+        return (latency, placement, curve) if return_curve else (latency, placement)
+
+    def __repr__(self):
+        return f"ProxyCache(directory={self.directory!r}, hits={self.hits}, resumes={self.resumes}, misses={self.misses})"
+
+
+# Adds the dtype and the values of an array to a digest. Integer arrays that fit into int64
+# are hashed as int64, so lists and arrays of the same integers share a key, floats and
+# Python ints beyond int64 are hashed as they are
+def _update_digest(digest, values):
+    if values.dtype.kind in "biu" and np.can_cast(values.dtype, np.int64):
+        values = values.astype(np.int64, copy=False)
+    digest.update(values.dtype.str.encode())
+    if values.dtype == object:
+        digest.update(repr(values.tolist()).encode())
+    else:
+        digest.update(np.ascontiguousarray(values).tobytes())
+
+
+# Follows the predecessors of the layers back from node n+1, a node that kept its value
+# in a layer did not use that layer's proxy
+def _placement(predecessors, n):
+    placement = []
+    j = n+1
+    for layer in reversed(predecessors):
+        i = int(layer[j])
+        if i == j:
+            continue
+        if i == 0:
+            break # served directly from v0, remaining proxies are not needed
+        placement.append(i)
+        if i == 1:
+            break # remaining proxies would be placed at node 1 as well
+        j = i
+    placement.reverse()
+    return placement
+
+
+if __name__ == "__main__":
+    # Example values
+    n = 7  # Number of nodes (excluding v0)
+    weights = [10, 15, 20, 25, 5, 8, 30]  # Weights of the nodes
+    distances = [2, 3, 5, 4, 1, 3, 2]  # Distances between consecutive nodes
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ProxyCache(directory)
+
+        for m in [2, 2, 4, 1]:
+            latency, placement = cache.solve(n, m, weights, distances)
+            print(f"Minimal total latency (m={m}): {latency}, proxies at nodes {placement}")
+
+        print(cache)
@@ -0,0 +1,81 @@
+from array import array
+from itertools import chain
+from smawk.monge_dp import monge_dp
+from proxy_problem.proxy_instance import ProxyInstance
+
+"""
+Result of `proxy_curve`: the DP table of one solve, stored layer by layer in a flat
+typed array (64-bit integers for integer instances, a list of Python ints for instances
+whose sums do not fit into them).
+
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    m (int): Largest number of proxies solved for
+    table (array): Flat table of (m+1) * (n+2) entries, entry k * (n+2) + j holding F[j][k+1]
+"""
+
+class ProxyCurve:
+    __slots__ = ("n", "m", "_table")
+
+    def __init__(self, n, m, table):
+        self.n = n
+        self.m = m
+        self._table = table
+
+    # Minimal latency of the prefix ending at node j with k proxies, node n+1 covers the whole line
+    def cost(self, j, k):
+        if not (0 <= j <= self.n+1 and 0 <= k <= self.m):
+            raise IndexError(f"No entry for node {j} with {k} proxies")
+        return self._table[k * (self.n+2) + j]
+
+    # Minimal total latency for every number of proxies k = 0..m
+    def curve(self):
+        row = self.n+1
+        return list(self._table[row::self.n+2])
+
+"""
+Computes the minimal total latency of every prefix of the line for every number of proxies
+up to m with a single DP run.
+
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    m (int): Largest number of proxies
+    weights (List[int]): Request frequency at each node
+    distances (List[int]): Distance between consecutive nodes
+    D (np.ndarray, optional): Prefix sums of the distances shared by the instances on the same line
+
+Returns:
+    ProxyCurve: Answers prefix queries in O(1) and exports the latency-vs-proxy-count curve
+"""
+def proxy_curve(n, m, weights, distances, D=None):
+    instance = ProxyInstance(n, weights, distances, D)
+
+    # Base cases F[j][1] = a(0, j) and F[1][1] = 0, nodes 0 and 1 keep 0 in every layer
+    initial = [instance.cost(0, j) for j in range(n+2)]
+    initial[1] = 0
+
+    # F[j][k] = min_{i<j} F[i][k-1] + a(i, j) for k = 2..m+1, one layer per proxy
+    layers, _ = monge_dp(n+2, m, initial, instance.cost, cumulative=True)
+
+    # Flatten the layers into the table without an intermediate list
+    values = chain.from_iterable(layers)
+    if instance.D.dtype == object:
+        table = list(values)
+    else:
+        table = array('q' if instance.D.dtype.kind in "iu" else 'd', values)
+
+    return ProxyCurve(n, m, table)
+
+
+if __name__ == "__main__":
+    # Example values
+    n = 7  # Number of nodes (excluding v0)
+    m = 4  # Largest number of proxies
+    weights = [10, 15, 20, 25, 5, 8, 30]  # Weights of the nodes
+    distances = [2, 3, 5, 4, 1, 3, 2]  # Distances between consecutive nodes
+
+    result = proxy_curve(n, m, weights, distances)
+
+    for k, latency in enumerate(result.curve()):
+        print(f"Minimal total latency (m={k}): {latency}")
+    print(f"Minimal latency up to node 4 with 1 proxy: {result.cost(4, 1)}")
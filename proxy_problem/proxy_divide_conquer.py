@@ -0,0 +1,83 @@
+import numpy as np
+from proxy_problem.proxy_instance import ProxyInstance
+from smawk.smawk_ndarray import segment_argmin, segment_offsets
+
+"""
+Computes the minimal total latency for placing m proxies among n nodes,
+using divide-and-conquer monotone argmin instead of SMAWK for every DP layer.
+
+Within a layer the optimal predecessor opt(j) is non-decreasing in j. Each node range
+is solved at its middle node, which splits the remaining nodes and candidate ranges in two.
+All middle nodes of one recursion level are evaluated together with NumPy, giving
+O(log n) vectorized steps of O(n) work per layer, O(mn log n) in total.
+
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    m (int): Number of proxies
+    weights (Sequence[int]): Request frequency at each node, a list or a buffer such as `np.memmap`
+    distances (Sequence[int]): Distance between consecutive nodes, a list or a buffer such as `np.memmap`
+
+Returns:
+    int: The minimal total latency
+"""
+def proxy_problem_divide_conquer(n, m, weights, distances):
+    instance = ProxyInstance(n, weights, distances)
+
+    # Base cases: F[j][1] = a(0, j) and F[1][k] = 0
+    previous = instance.cost_row(0)
+    previous[1] = 0
+
+    # Dynamic Programming via divide and conquer
+    for k in range(2, m+2):
+        current = previous.copy()
+
+        # Open node ranges [low, high] with candidate ranges [opt_low, opt_high]
+        num_ranges = 1 if n >= 1 else 0
+        low = np.full(num_ranges, 2)
+        high = np.full(num_ranges, n+1)
+        opt_low = np.full(num_ranges, 1)
+        opt_high = np.full(num_ranges, n)
+
+        while len(low) > 0:
+            mid = (low + high) // 2
+            window_low = opt_low
+            window_high = np.minimum(mid - 1, opt_high)
+
+            # Evaluate the candidate windows of all middle nodes at once
+            lengths = window_high - window_low + 1
+            offsets = segment_offsets(lengths)
+            i = np.repeat(window_low, lengths) + offsets
+            j = np.repeat(mid, lengths)
+            values = previous[i] + instance.costs(i, j)
+
+            window_argmin, window_minima = segment_argmin(values, lengths)
+            opt = window_low + window_argmin
+            current[mid] = window_minima
+
+            # Split every range at its middle node
+            left = low <= mid - 1
+            right = mid + 1 <= high
+            low, high, opt_low, opt_high = (
+                np.concatenate((low[left], mid[right] + 1)),
+                np.concatenate((mid[left] - 1, high[right])),
+                np.concatenate((opt_low[left], opt[right])),
+                np.concatenate((opt[left], opt_high[right])),
+            )
+
+        previous = current
+
+    return previous[n+1].item()
+
+
+if __name__ == "__main__":
+    # Example values
+    n = 7  # Number of nodes (excluding v0)
+    m = 2  # Number of proxies
+    weights = [10, 15, 20, 25, 5, 8, 30]  # Weights of the nodes
+    distances = [2, 3, 5, 4, 1, 3, 2]  # Distances between consecutive nodes
+
+    result1 = proxy_problem_divide_conquer(n, 0, weights, distances)
+    result2 = proxy_problem_divide_conquer(n, m, weights, distances)
+
+    print(f"Minimal total latency with no proxies: {result1}")
+    print(f"Minimal total latency (m=2): {result2}")
@@ -1,28 +1,5 @@
 from smawk.smawk_explicit_matrix import smawk
-
-def preprocess_sums(n, distances, weights):
-    distances = [0] + distances + [0]
-    weights = [0] + weights + [0]
-    D = [0] * (n+2)
-    W = [weights[n]] * (n+2)
-    X = [0] * (n+2)
-    Y = [0] *(n+2)
-
-    for j in range(1, n+2):
-        D[j] = D[j-1] + distances[j]
-
-    for j in range(n, -1, -1):
-        W[j] = W[j+1] + weights[j]
-
-    for j in range(1, n+2):
-        X[j] = X[j-1] + distances[j] * W[j]
-
-    Y[n+1] = weights[n+1] * D[n+1]
-    for j in range(n, -1, -1):
-        Y[j] = Y[j+1] + weights[j]*D[j]
-
-    return D, W, X, Y
-
+from proxy_problem.proxy_instance import ProxyInstance
 
 """
 Computes the minimal total latency for placing m proxies among n nodes.
@@ -32,16 +9,16 @@ Parameters:
     m (int): Number of proxies
     weights (List[int]): Request frequency at each node
     distances (List[int]): Distance between consecutive nodes
+    probe (SmawkProbe, optional): Collects the statistics of every SMAWK search
 
 Returns:
     int: The minimal total latency
 """
-def proxy_problem_explicit_matrix(n, m, weights, distances):
-    D, W, X, Y = preprocess_sums(n, distances, weights)
+def proxy_problem_explicit_matrix(n, m, weights, distances, probe=None):
+    instance = ProxyInstance(n, weights, distances)
 
     # cost function
-    def a(i, j):
-        return Y[0] - Y[j] - X[i] + D[i] * W[j]
+    a = instance.cost
     
     # Initialize DP table
     F = [[float('inf') for _ in range(m+2)] for _ in range(n+2)]
@@ -64,11 +41,11 @@ def proxy_problem_explicit_matrix(n, m, weights, distances):
                 M[j][i] = F[i][k-1] + a(i, j)
 
         # Use SMAWK to find row-minima in M^T
-        minima = smawk(M)
+        minima, values = smawk(M, return_values=True, probe=probe)
 
-        # Update DP Table using minima positions
+        # Update DP Table using the row-minima values
         for j in range(2,n+2):
-            F[j][k]= M[j][minima[j]]
+            F[j][k]= values[j]
 
     return F[n+1][m+1]
 
@@ -0,0 +1,141 @@
+from array import array
+from smawk.monge_matrix import MongeMatrix
+
+"""
+Stateful proxy solver that re-solves incrementally after point updates
+of weights or distances.
+
+The cost is evaluated from prefix sums over the nodes,
+
+    a(i, j) = sum_{i < t < j} w_t (D_t - D_i) = P[j-1] - P[i] - D[i] * (S[j-1] - S[i]),
+
+with D, S and P the prefix sums of the distances, the weights and w_t * D_t. An edit at
+node t therefore only changes the prefix sums from t on and the costs a(i, j) with j > t.
+On the next `solve()` the prefix sums are rebuilt from the lowest edited node, and every
+DP layer is recomputed only for the nodes after it. The DP values and optimal predecessors
+of all earlier nodes are reused, and the predecessor of the last unchanged node bounds
+the columns that have to be searched.
+
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    m (int): Number of proxies
+    weights (List[int]): Request frequency at each node
+    distances (List[int]): Distance between consecutive nodes
+"""
+
+class IncrementalProxySolver:
+    def __init__(self, n, m, weights, distances):
+        self.n = n
+        self.m = m
+        self._weights = [0] + list(weights[:n]) + [0]
+        self._distances = [0] + list(distances[:n]) + [0]
+        self._D = [0] * (n+2)
+        self._S = [0] * (n+2)
+        self._P = [0] * (n+2)
+
+        # F[k][j] and predecessors[k][j] for layers k = 1..m+1, index 0 unused
+        self._F = [None] + [[float('inf')] * (n+2) for _ in range(m+1)]
+        self._predecessors = [None] + [array('i', [0]) * (n+2) for _ in range(m+1)]
+
+        self._dirty = 1 # lowest node whose prefix sums and DP values are outdated
+
+    # Sets the request frequency of node index+1, like weights[index] = value
+    def update_weight(self, index, value):
+        self._weights[index+1] = value
+        self._dirty = min(self._dirty, index+1)
+
+    # Sets the distance between node index and node index+1, like distances[index] = value
+    def update_distance(self, index, value):
+        self._distances[index+1] = value
+        self._dirty = min(self._dirty, index+1)
+
+    # Brings the DP up to date with all updates since the last call and returns the minimal total latency
+    def solve(self):
+        n = self.n
+        start = self._dirty
+        if start <= n+1:
+            self._update_prefix_sums(start)
+            self._update_layers(start)
+        self._dirty = n+2
+
+        return self._F[self.m+1][n+1]
+
+    # Ascending node indices of the proxies in the last solved placement
+    def placement(self):
+        placement = []
+        j = self.n+1
+        for k in range(self.m+1, 1, -1):
+            j = self._predecessors[k][j]
+            if j == 0:
+                break # served directly from v0, remaining proxies are not needed
+            placement.append(j)
+            if j == 1:
+                break # remaining proxies would be placed at node 1 as well
+        placement.reverse()
+        return placement
+
+    def _update_prefix_sums(self, start):
+        w, d, D, S, P = self._weights, self._distances, self._D, self._S, self._P
+        for t in range(max(start, 1), self.n+2):
+            D[t] = D[t-1] + d[t]
+            S[t] = S[t-1] + w[t]
+            P[t] = P[t-1] + w[t] * D[t]
+
+    def _update_layers(self, start):
+        n = self.n
+        D, S, P = self._D, self._S, self._P
+
+        # cost function
+        def a(i, j):
+            return P[j-1] - P[i] - D[i] * (S[j-1] - S[i])
+
+        # Base cases: F[j][1] = a(0, j), F[0][1] = 0 and F[1][k] = 0
+        first = self._F[1]
+        for j in range(max(start, 2), n+2):
+            first[j] = a(0, j)
+        first[0] = 0
+        first[1] = 0
+        for k in range(2, self.m+2):
+            self._F[k][1] = 0
+
+        # Only the columns j >= low of M change, all other DP values are kept
+        low = max(start, 2)
+        if low > n+1:
+            return
+
+        previous = None
+
+        # M[i][j] = F[i][k-1] + a(i, j) of the current layer, whose column minima are F[j][k]
+        def lookup(i, j):
+            if i >= j:
+                return float('inf')
+            return previous[i] + a(i, j)
+
+        matrix = MongeMatrix(n+2, n+2, lookup)
+
+        for k in range(2, self.m+2):
+            previous = self._F[k-1]
+            current = self._F[k]
+            predecessors = self._predecessors[k]
+
+            # Column low-1 is unchanged, so by monotonicity of the column minima
+            # its previous argmin is a lower bound for the argmins of all changed columns
+            first_row = predecessors[low-1] if low-1 >= 2 else 0
+
+            minima, values = matrix[first_row:n+1, low:n+2].column_minima(return_values=True)
+            current[low:] = values
+            predecessors[low:] = array('i', [first_row + i for i in minima])
+
+if __name__ == "__main__":
+    # Example values
+    n = 7  # Number of nodes (excluding v0)
+    m = 2  # Number of proxies
+    weights = [10, 15, 20, 25, 5, 8, 30]  # Weights of the nodes
+    distances = [2, 3, 5, 4, 1, 3, 2]  # Distances between consecutive nodes
+
+    solver = IncrementalProxySolver(n, m, weights, distances)
+    print(f"Minimal total latency (m=2): {solver.solve()}")
+
+    solver.update_weight(5, 40)
+    solver.update_distance(6, 1)
+    print(f"Minimal total latency after updating nodes 6 and 7: {solver.solve()}")
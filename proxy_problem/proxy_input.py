@@ -0,0 +1,114 @@
+import numpy as np
+
+"""
+Opens the weights and distances of a proxy instance stored as raw binary files.
+
+The files are memory-mapped read-only, so nodes are paged in on access instead of
+being loaded as Python lists.
+
+Parameters:
+    weights_path (str): File of n request frequencies
+    distances_path (str): File of n distances between consecutive nodes
+    dtype (np.dtype): Element type of both files
+
+Returns:
+    (int, np.memmap, np.memmap): The number of nodes n, the weights and the distances
+"""
+def load_instance(weights_path, distances_path, dtype=np.int64):
+    weights = np.memmap(weights_path, dtype=dtype, mode='r')
+    distances = np.memmap(distances_path, dtype=dtype, mode='r')
+    if len(weights) != len(distances):
+        raise ValueError(f"{weights_path} holds {len(weights)} weights but {distances_path} holds {len(distances)} distances")
+    return len(weights), weights, distances
+
+"""
+Computes the prefix sums D, W, X, Y of a proxy instance into preallocated typed arrays
+(int64 for integer inputs).
+
+Integer instances whose costs could exceed int64, that is where the total distance times the
+total weight reaches 2**61, are summed into object arrays of exact Python ints instead.
+
+`weights` and `distances` may be lists or any buffer-protocol object such as `np.memmap`
+or `array('q')`. Buffers are read in place, and every sum is accumulated directly into
+its output array without intermediate lists.
+
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    distances (Sequence[int]): Distance between consecutive nodes
+    weights (Sequence[int]): Request frequency at each node
+    D (np.ndarray, optional): D of an earlier call on the same distances, reused if it has
+        the element type of this call
+
+Returns:
+    (np.ndarray, np.ndarray, np.ndarray, np.ndarray): D, W, X and Y of length n+2
+"""
+def prefix_sums(n, distances, weights, D=None):
+    distances = np.asarray(distances)[:n]
+    weights = np.asarray(weights)[:n]
+
+    dtype = np.result_type(distances, weights, np.int64)
+    if dtype.kind in "iu" and _may_overflow(distances, weights):
+        dtype = np.dtype(object)
+        distances = distances.astype(object)
+        weights = weights.astype(object)
+    W = np.zeros(n+2, dtype=dtype)
+    X = np.zeros(n+2, dtype=dtype)
+    Y = np.zeros(n+2, dtype=dtype)
+
+    # D[j] = d_1 + ... + d_j
+    if D is None or D.dtype != dtype:
+        D = np.zeros(n+2, dtype=dtype)
+        np.cumsum(distances, out=D[1:n+1])
+        D[n+1] = D[n]
+
+    # W[j] = w_j + ... + w_n
+    np.cumsum(weights[::-1], out=W[n:0:-1])
+    W[0] = W[1]
+
+    # X[j] = sum_{t <= j} d_t * W[t]
+    np.multiply(distances, W[1:n+1], out=X[1:n+1])
+    np.cumsum(X[1:n+1], out=X[1:n+1])
+    X[n+1] = X[n]
+
+    # Y[j] = sum_{t >= j} w_t * D[t]
+    np.multiply(weights, D[1:n+1], out=Y[1:n+1])
+    np.cumsum(Y[n:0:-1], out=Y[n:0:-1])
+    Y[0] = Y[1]
+
+    return D, W, X, Y
+
+# Whether a prefix sum, a cost a(i, j) or a DP value F[i] + a(i, j) may not fit into int64.
+# All of them are bounded by 4 times the total distance times the total weight, the totals
+# are taken in floating point as they may not fit themselves
+def _may_overflow(distances, weights):
+    total_distance = np.abs(distances).sum(dtype=np.float64)
+    total_weight = np.abs(weights).sum(dtype=np.float64)
+    return float(total_distance) * float(total_weight) >= 2**61
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+    from proxy_problem.proxy_divide_conquer import proxy_problem_divide_conquer
+
+    # Example values, written to binary files and memory-mapped again
+    m = 2  # Number of proxies
+    weights = np.array([10, 15, 20, 25, 5, 8, 30], dtype=np.int64)  # Weights of the nodes
+    distances = np.array([2, 3, 5, 4, 1, 3, 2], dtype=np.int64)  # Distances between consecutive nodes
+
+    with tempfile.TemporaryDirectory() as directory:
+        weights_path = os.path.join(directory, "weights.bin")
+        distances_path = os.path.join(directory, "distances.bin")
+        weights.tofile(weights_path)
+        distances.tofile(distances_path)
+
+        n, weights_map, distances_map = load_instance(weights_path, distances_path)
+        result = proxy_problem_divide_conquer(n, m, weights_map, distances_map)
+        del weights_map, distances_map
+
+    print(f"Minimal total latency (m=2): {result}")
+
+    # Sums that do not fit into int64 are kept exact
+    D, W, X, Y = prefix_sums(3, [10**12] * 3, [10**7] * 3)
+    assert D.dtype == object and Y[0] == 6 * 10**19
+    print(f"Exact prefix sum beyond int64: Y[0] = {Y[0]}")
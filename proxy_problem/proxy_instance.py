@@ -0,0 +1,64 @@
+import numpy as np
+from proxy_problem.proxy_input import prefix_sums
+
+"""
+A proxy instance on a line of n nodes with its prefix sums D, W, X, Y computed once.
+
+The cost of serving the nodes strictly between i and j from a proxy at node i is
+
+    a(i, j) = Y[0] - Y[j] - X[i] + D[i] * W[j]
+
+and can be evaluated for a single entry, a slice of a row or a whole block.
+
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    weights (Sequence[int]): Request frequency at each node, a list or a buffer such as `np.memmap`
+    distances (Sequence[int]): Distance between consecutive nodes, a list or a buffer such as `np.memmap`
+    D (np.ndarray, optional): Prefix sums of the distances shared by the instances on the same line
+"""
+
+class ProxyInstance:
+    __slots__ = ("n", "D", "W", "X", "Y", "_D", "_W", "_X", "_Y", "_Y0")
+
+    def __init__(self, n, weights, distances, D=None):
+        self.n = n
+        self.D, self.W, self.X, self.Y = prefix_sums(n, distances, weights, D)
+
+    # Python scalars for fast single-entry evaluation, only built for the solvers that call cost()
+    def _build_scalars(self):
+        self._D, self._W, self._X, self._Y = (s.tolist() for s in (self.D, self.W, self.X, self.Y))
+        self._Y0 = self._Y[0]
+
+    # a(i, j) for a single entry
+    def cost(self, i, j):
+        try:
+            return self._Y0 - self._Y[j] - self._X[i] + self._D[i] * self._W[j]
+        except AttributeError: # first call, the slots are not set yet
+            self._build_scalars()
+            return self._Y0 - self._Y[j] - self._X[i] + self._D[i] * self._W[j]
+
+    # a(i, j) element-wise for broadcastable index arrays i and j
+    def costs(self, i, j):
+        return self.Y[0] - self.Y[j] - self.X[i] + self.D[i] * self.W[j]
+
+    # a(i, j) for j in [start, stop)
+    def cost_row(self, i, start=0, stop=None):
+        j = np.arange(start, self.n+2 if stop is None else stop)
+        return self.costs(i, j)
+
+    # a(i, j) for all i in rows and j in columns
+    def cost_block(self, rows, columns):
+        return self.costs(np.asarray(rows)[:, None], np.asarray(columns)[None, :])
+
+
+if __name__ == "__main__":
+    # Example values
+    n = 7  # Number of nodes (excluding v0)
+    weights = [10, 15, 20, 25, 5, 8, 30]  # Weights of the nodes
+    distances = [2, 3, 5, 4, 1, 3, 2]  # Distances between consecutive nodes
+
+    instance = ProxyInstance(n, weights, distances)
+
+    print(f"Latency without proxies: {instance.cost(0, n+1)}")
+    print(f"Costs from a proxy at node 2: {instance.cost_row(2, 3).tolist()}")
+    print(f"Cost block for proxies at nodes 1..3 serving up to nodes 4..5:\n{instance.cost_block(range(1, 4), range(4, 6))}")
@@ -0,0 +1,62 @@
+from proxy_problem.proxy_instance import ProxyInstance
+from proxy_problem.proxy_opening_cost import penalized_proxy_problem
+
+"""
+Computes the minimal total latency for placing m proxies among n nodes
+by Lagrangian relaxation of the proxy count.
+
+The optimal latency is convex in the number of proxies, so for the right per-proxy
+penalty the single-layer problem uses exactly as many proxies as allowed. The penalty
+is found by binary search, which makes the runtime independent of m. Each step solves
+the single-layer problem online in O(n), so the runtime is O(n log C) for the total
+latency C without proxies.
+
+Preconditions:
+    - `weights` and `distances` must be non-negative integers
+
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    m (int): Number of proxies
+    weights (List[int]): Request frequency at each node
+    distances (List[int]): Distance between consecutive nodes
+
+Returns:
+    int: The minimal total latency
+"""
+def proxy_problem_lagrangian(n, m, weights, distances):
+    instance = ProxyInstance(n, weights, distances)
+
+    # cost function
+    a = instance.cost
+
+    # Without penalty the optimum already uses at most m proxies
+    value, count = penalized_proxy_problem(n, a, 0)
+    if count <= m:
+        return value
+
+    # Binary search for adjacent penalties whose optima use more than m and at most m proxies
+    low, high = 0, a(0, n+1) + 1 # no proxy pays off once the penalty exceeds the total latency
+    while high - low > 1:
+        mid = (low + high) // 2
+        value, count = penalized_proxy_problem(n, a, mid)
+        if count > m:
+            low = mid
+        else:
+            high = mid
+
+    # The Lagrangian dual value G(penalty) - penalty * m is maximized at one of the two
+    return max(penalized_proxy_problem(n, a, penalty)[0] - penalty * m for penalty in (low, high))
+
+
+if __name__ == "__main__":
+    # Example values
+    n = 7  # Number of nodes (excluding v0)
+    m = 2  # Number of proxies
+    weights = [10, 15, 20, 25, 5, 8, 30]  # Weights of the nodes
+    distances = [2, 3, 5, 4, 1, 3, 2]  # Distances between consecutive nodes
+
+    result1 = proxy_problem_lagrangian(n, 0, weights, distances)
+    result2 = proxy_problem_lagrangian(n, m, weights, distances)
+
+    print(f"Minimal total latency with no proxies: {result1}")
+    print(f"Minimal total latency (m=2): {result2}")
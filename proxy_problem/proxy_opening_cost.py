@@ -0,0 +1,63 @@
+from smawk.smawk_online import OnlineMonotoneMinima
+from proxy_problem.proxy_instance import ProxyInstance
+
+"""
+Solves the single-layer proxy problem in which every proxy costs `penalty`:
+
+    G[j] = min( a(0, j), min_{1 <= i < j} G[i] + a(i, j) + penalty )
+
+Row i of this recurrence depends on G[i], so the nodes are finished one at a time by the
+online engine `OnlineMonotoneMinima`, which needs amortized O(1) evaluations of a per node.
+
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    a (Callable[[int, int], int]): Cost function of the proxy problem
+    penalty (int): Cost charged per proxy
+
+Returns:
+    (int, int): The minimal penalized latency G[n+1] and the number of proxies it uses
+"""
+def penalized_proxy_problem(n, a, penalty):
+    # Node 0 is a virtual predecessor so that its single "transition" is the base case a(0, j)
+    def value(i, j):
+        return G[i] + a(i, j) + penalty
+
+    online = OnlineMonotoneMinima(n+2, value, -penalty)
+    G = online.values
+    online.value(n+1)
+
+    # Proxies on the optimal path, ties go to the leftmost predecessor
+    predecessors = online.indices
+    count = [-1] * (n+2)
+    for j in range(1, n+2):
+        count[j] = count[predecessors[j]] + 1
+
+    return G[n+1], count[n+1]
+
+"""
+Computes the minimal total latency plus opening costs when every proxy costs `opening_cost`
+and the number of proxies is free.
+
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    opening_cost (int): Cost charged per proxy
+    weights (List[int]): Request frequency at each node
+    distances (List[int]): Distance between consecutive nodes
+
+Returns:
+    (int, int): The minimal latency plus opening costs and the number of proxies opened
+"""
+def proxy_problem_opening_cost(n, opening_cost, weights, distances):
+    instance = ProxyInstance(n, weights, distances)
+    return penalized_proxy_problem(n, instance.cost, opening_cost)
+
+
+if __name__ == "__main__":
+    # Example values
+    n = 7  # Number of nodes (excluding v0)
+    weights = [10, 15, 20, 25, 5, 8, 30]  # Weights of the nodes
+    distances = [2, 3, 5, 4, 1, 3, 2]  # Distances between consecutive nodes
+
+    for opening_cost in [0, 20, 60, 200]:
+        total, count = proxy_problem_opening_cost(n, opening_cost, weights, distances)
+        print(f"Opening cost {opening_cost}: total cost {total} with {count} proxies")
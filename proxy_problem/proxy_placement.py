@@ -0,0 +1,48 @@
+from smawk.monge_dp import monge_dp, trace_back
+from proxy_problem.proxy_instance import ProxyInstance
+
+"""
+Computes the minimal total latency for placing m proxies among n nodes
+together with the nodes the proxies are placed at.
+
+The DP runs on `monge_dp` like `proxy_problem`, and the placement is read off the argmins
+of its layers with `trace_back`.
+
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    m (int): Number of proxies
+    weights (List[int]): Request frequency at each node
+    distances (List[int]): Distance between consecutive nodes
+
+Returns:
+    (int, List[int]): The minimal total latency and the ascending node indices of the proxies.
+                      Fewer than m nodes are returned if additional proxies do not lower the latency.
+"""
+def proxy_problem_with_placement(n, m, weights, distances):
+    instance = ProxyInstance(n, weights, distances)
+
+    # Base cases F[j][1] = a(0, j) and F[1][1] = 0
+    initial = [instance.cost(0, j) for j in range(n+2)]
+    initial[1] = 0
+
+    # F[j][k] = min_{i<j} F[i][k-1] + a(i, j), a node keeps its value if another proxy does not help
+    layers, argmins = monge_dp(n+2, m, initial, instance.cost, cumulative=True)
+
+    # The path ends at node n+1, a path starting at node 0 spends its first transition on v0
+    path = trace_back(argmins, n+1)
+    placement = [j for j in path[:-1] if j != 0]
+
+    return layers[m][n+1], placement
+
+
+if __name__ == "__main__":
+    # Example values
+    n = 7  # Number of nodes (excluding v0)
+    m = 2  # Number of proxies
+    weights = [10, 15, 20, 25, 5, 8, 30]  # Weights of the nodes
+    distances = [2, 3, 5, 4, 1, 3, 2]  # Distances between consecutive nodes
+
+    latency, placement = proxy_problem_with_placement(n, m, weights, distances)
+
+    print(f"Minimal total latency (m=2): {latency}")
+    print(f"Proxies placed at nodes: {placement}")
@@ -0,0 +1,294 @@
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import time
+import numpy as np
+from proxy_problem.proxy_curve import proxy_curve
+
+_attached = OrderedDict() # topology blocks attached by a worker process, name -> (block, distances, D)
+_max_attached = 64
+
+def _digest(values):
+    return hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+
+# A JSON list of integers as an int64 array, floats, booleans and integers beyond int64 are rejected
+def _int64_array(values, name):
+    array = np.asarray(values)
+    if array.ndim != 1 or (array.size and (array.dtype.kind not in "iu" or not np.can_cast(array.dtype, np.int64))):
+        raise ValueError(f"{name} must be a list of 64-bit integers")
+    return array.astype(np.int64)
+
+# Distances and D of the topology in a shared block, attached once per worker process
+def _attach(name, n):
+    if name not in _attached:
+        block = shared_memory.SharedMemory(name=name)
+        arrays = np.ndarray((2, n+2), dtype=np.int64, buffer=block.buf)
+        _attached[name] = (block, arrays[0, :n], arrays[1])
+        del arrays
+        while len(_attached) > _max_attached:
+            evicted = _attached.popitem(last=False)[1][0] # its views are dropped with the entry
+            evicted.close()
+    _attached.move_to_end(name)
+    _, distances, D = _attached[name]
+    return distances, D
+
+# Minimal total latency for every k = 0..m on a cached topology
+def _solve_curve(name, n, m, weights):
+    distances, D = _attach(name, n)
+    return proxy_curve(n, m, weights, distances, D).curve()
+
+"""
+Serves proxy solves to many concurrent clients from one long-running process.
+
+A topology is the list of distances of a line. Its distances and their prefix sums D are
+stored once in a shared memory block, kept in an LRU cache under their digest, which is
+returned with every response, so later requests may send the digest as "topology" instead of
+the distances. A solve sends only the name of the block and the weights to a worker, which
+attaches to the block once. Requests for the same topology
+and weights that arrive within `coalesce_window` seconds of the first one, or while its solve
+is running if they do not ask for a larger m, are answered by a single `proxy_curve` solve
+for the largest m among them, which yields the latency of every smaller m as well. Solves run
+on a process pool, so the event loop only parses, hashes and dispatches.
+Weights and distances must be 64-bit integers, other values are answered with an error
+instead of being truncated.
+
+Parameters:
+    max_workers (int, optional): Number of worker processes, defaults to the CPU count
+    coalesce_window (float): Seconds a solve waits for further requests to join it
+    max_topologies (int): Number of topologies kept in the cache
+    latency_samples (int): Number of recent request latencies kept for the percentiles
+
+Attributes:
+    requests (int): Number of answered solve requests
+    solves (int): Number of solves dispatched to the pool
+"""
+
+class ProxyService:
+    def __init__(self, max_workers=None, coalesce_window=0.005, max_topologies=64, latency_samples=10000):
+        self.coalesce_window = coalesce_window
+        self.max_topologies = max_topologies
+        self.requests = 0
+        self.solves = 0
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._topologies = OrderedDict() # digest -> _Topology
+        self._batches = {} # (topology, weights digest) -> latest batch of requests on that input
+        self._latencies = deque(maxlen=latency_samples)
+
+    # Topology of a request with n nodes from the cache, adding it if the distances are sent along
+    def _topology(self, distances, topology, n):
+        if distances is not None:
+            distances = _int64_array(distances, "distances")
+            if len(distances) != n:
+                raise ValueError(f"{n} weights for {len(distances)} distances")
+            topology = _digest(distances)
+            if topology not in self._topologies:
+                self._topologies[topology] = _Topology(distances)
+        elif topology not in self._topologies:
+            raise ValueError(f"Unknown topology {topology!r}, send the distances")
+        elif self._topologies[topology].n != n:
+            raise ValueError(f"{n} weights for a topology of {self._topologies[topology].n} nodes")
+
+        self._topologies.move_to_end(topology)
+        while len(self._topologies) > self.max_topologies:
+            self._topologies.popitem(last=False)[1].evict()
+        return topology, self._topologies[topology]
+
+    # Minimal total latency for m proxies, shared with concurrent requests on the same input
+    async def solve(self, m, weights, distances=None, topology=None):
+        if not isinstance(m, int) or isinstance(m, bool) or m < 0:
+            raise ValueError(f"m must be a non-negative integer, got {m!r}")
+        weights = _int64_array(weights, "weights")
+        topology, line = self._topology(distances, topology, len(weights))
+
+        # Join the batch on the same input while it collects requests, or while it is being
+        # solved if its curve reaches m, otherwise start a new batch
+        loop = asyncio.get_running_loop()
+        key = (topology, _digest(weights))
+        batch = self._batches.get(key)
+        if batch is None or (batch.m is not None and min(m, len(weights)) > batch.m):
+            batch = self._batches[key] = _Batch(weights)
+            line.pending += 1 # the block is kept until the solve is done
+            loop.call_later(self.coalesce_window, self._dispatch, key, batch, line)
+
+        future = loop.create_future()
+        batch.waiters.append((m, future))
+        return await future, topology
+
+    # Runs one solve for all requests collected in a batch
+    def _dispatch(self, key, batch, line):
+        n = len(batch.weights)
+        batch.m = min(max(m for m, _ in batch.waiters), n) # the latency does not drop any further once every node has a proxy
+        self.solves += 1
+
+        def resolve(solve):
+            if self._batches.get(key) is batch:
+                del self._batches[key]
+            line.pending -= 1
+            line.release()
+
+            error = asyncio.CancelledError() if solve.cancelled() else solve.exception()
+            curve = None if error else solve.result()
+            for k, future in batch.waiters:
+                if future.done():
+                    continue
+                if error:
+                    future.set_exception(error)
+                else:
+                    future.set_result(curve[min(k, batch.m)])
+
+        solve = asyncio.get_running_loop().run_in_executor(self._executor, _solve_curve, line.block.name, n, batch.m, batch.weights)
+        solve.add_done_callback(resolve)
+
+    # Answers one JSON request, errors are reported in the response
+    async def handle(self, line):
+        start_time = time.perf_counter()
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            if request.get("op") == "stats":
+                return {"id": request_id, **self.stats()}
+
+            latency, topology = await self.solve(request["m"], request["weights"],
+                                                 request.get("distances"), request.get("topology"))
+            self.requests += 1
+            self._latencies.append(time.perf_counter() - start_time)
+            return {"id": request_id, "latency": latency, "topology": topology}
+        except Exception as error:
+            return {"id": request_id, "error": f"{type(error).__name__}: {error}"}
+
+    # Requests of one connection are answered concurrently and in order of completion
+    async def serve_connection(self, reader, writer):
+        tasks = set()
+
+        async def respond(line):
+            response = await self.handle(line)
+            writer.write((json.dumps(response) + "\n").encode())
+            await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    task = asyncio.create_task(respond(line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    # Request latency percentiles in milliseconds
+    def stats(self):
+        latencies = np.array(self._latencies) * 1000
+        p50, p99 = np.percentile(latencies, [50, 99]).tolist() if len(latencies) else (None, None)
+        return {"requests": self.requests, "solves": self.solves, "topologies": len(self._topologies),
+                "p50_ms": p50, "p99_ms": p99}
+
+    def close(self):
+        self._executor.shutdown()
+        while self._topologies:
+            line = self._topologies.popitem()[1]
+            line.pending = 0
+            line.evict()
+
+
+# Distances and their prefix sums D of a topology in a shared memory block, unlinked once
+# the topology is evicted and no solve on it is pending
+class _Topology:
+    __slots__ = ("n", "block", "pending", "evicted")
+
+    def __init__(self, distances):
+        self.n = n = len(distances)
+        self.block = shared_memory.SharedMemory(create=True, size=16 * (n+2))
+        arrays = np.ndarray((2, n+2), dtype=np.int64, buffer=self.block.buf)
+        arrays[0, :n] = distances
+        arrays[1, 0] = 0
+        np.cumsum(distances, out=arrays[1, 1:n+1])
+        arrays[1, n+1] = arrays[1, n]
+        del arrays
+        self.pending = 0 # number of batches waiting for a solve on the topology
+        self.evicted = False
+
+    def evict(self):
+        self.evicted = True
+        self.release()
+
+    def release(self):
+        if self.evicted and self.pending == 0 and self.block is not None:
+            self.block.close()
+            self.block.unlink()
+            self.block = None
+
+
+class _Batch:
+    __slots__ = ("weights", "m", "waiters")
+
+    def __init__(self, weights):
+        self.weights = weights
+        self.m = None # largest number of proxies solved for, None until dispatched
+        self.waiters = [] # (m, future) of every request in the batch
+
+
+"""
+Serves a `ProxyService` on a TCP or Unix socket with a JSON-lines protocol. Each line is one
+request and is answered by one line carrying the same "id":
+
+    {"id": 1, "m": 2, "weights": [...], "distances": [...]}  ->  {"id": 1, "latency": ..., "topology": "..."}
+    {"id": 2, "m": 3, "weights": [...], "topology": "..."}   ->  {"id": 2, "latency": ..., "topology": "..."}
+    {"id": 3, "op": "stats"}                                  ->  {"id": 3, "requests": ..., "p50_ms": ..., "p99_ms": ...}
+
+A request that cannot be answered gets {"id": ..., "error": "..."} instead.
+
+Parameters:
+    service (ProxyService): The service answering the requests
+    host (str): Address of the TCP socket
+    port (int): Port of the TCP socket
+    unix_path (str, optional): Path of a Unix socket to serve on instead of TCP
+    report_interval (float, optional): Seconds between latency reports on stderr
+    max_line (int): Maximal length of a request line in bytes
+"""
+async def serve(service, host="127.0.0.1", port=8765, unix_path=None, report_interval=None, max_line=2**26):
+    if unix_path:
+        server = await asyncio.start_unix_server(service.serve_connection, path=unix_path, limit=max_line)
+    else:
+        server = await asyncio.start_server(service.serve_connection, host, port, limit=max_line)
+    for socket in server.sockets:
+        print(f"Serving on {socket.getsockname()}", file=sys.stderr)
+
+    async with server:
+        if not report_interval:
+            return await server.serve_forever()
+
+        # Report the latency percentiles periodically while serving
+        server_task = asyncio.create_task(server.serve_forever())
+        while not server_task.done():
+            await asyncio.sleep(report_interval)
+            print(json.dumps(service.stats()), file=sys.stderr)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve proxy solves over a JSON-lines socket.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address of the TCP socket")
+    parser.add_argument("--port", type=int, default=8765, help="Port of the TCP socket")
+    parser.add_argument("--unix", help="Path of a Unix socket to serve on instead of TCP")
+    parser.add_argument("--workers", type=int, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--window", type=float, default=0.005, help="Seconds a solve waits for requests to coalesce")
+    parser.add_argument("--report-interval", type=float, default=60, help="Seconds between latency reports on stderr")
+    args = parser.parse_args(argv)
+
+    service = ProxyService(args.workers, args.window)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix, args.report_interval))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(service.stats()), file=sys.stderr)
+        service.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,30 +1,36 @@
-from smawk.smawk_with_lookup import smawk_with_lookup
+import numpy as np
+from smawk.monge_dp import monge_dp
+from smawk.smawk_batched import smawk_batched
+from proxy_problem.proxy_instance import ProxyInstance
 
-def preprocess_sums(n, distances, weights):
-    distances = [0] + distances + [0]
-    weights = [0] + weights + [0]
-    D = [0] * (n+2)
-    W = [weights[n]] * (n+2)
-    X = [0] * (n+2)
-    Y = [0] *(n+2)
+"""
+Computes the minimal total latency for placing m proxies among n nodes.
 
-    for j in range(1, n+2):
-        D[j] = D[j-1] + distances[j]
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    m (int): Number of proxies
+    weights (List[int]): Request frequency at each node
+    distances (List[int]): Distance between consecutive nodes
+    probe (SmawkProbe, optional): Collects the statistics of every SMAWK search
 
-    for j in range(n, -1, -1):
-        W[j] = W[j+1] + weights[j]
+Returns:
+    int: The minimal total latency
+"""
+def proxy_problem(n, m, weights, distances, probe=None):
+    instance = ProxyInstance(n, weights, distances)
 
-    for j in range(1, n+2):
-        X[j] = X[j-1] + distances[j] * W[j]
+    # Base cases F[j][1] = a(0, j) and F[1][1] = 0
+    initial = [instance.cost(0, j) for j in range(n+2)]
+    initial[1] = 0
 
-    Y[n+1] = weights[n+1] * D[n+1]
-    for j in range(n, -1, -1):
-        Y[j] = Y[j+1] + weights[j]*D[j]
+    # F[j][k] = min_{i<j} F[i][k-1] + a(i, j), node 1 keeps F[1][k] = 0 in every layer
+    layers, _ = monge_dp(n+2, m, initial, instance.cost, cumulative=True, probe=probe)
 
-    return D, W, X, Y
+    return layers[m][n+1]
 
 """
-Computes the minimal total latency for placing m proxies among n nodes.
+Computes the minimal total latency for placing m proxies among n nodes,
+evaluating the entries of M^T in batches via `smawk_vectorized`.
 
 Parameters:
     n (int): Number of nodes (excluding v0)
@@ -33,42 +39,60 @@ Parameters:
     distances (List[int]): Distance between consecutive nodes
 
 Returns:
-    int: The minimal total latency
+    float: The minimal total latency
 """
-def proxy_problem(n, m, weights, distances):
-    D, W, X, Y = preprocess_sums(n, distances, weights)
+def proxy_problem_vectorized(n, m, weights, distances):
+    instance = ProxyInstance(n, weights, distances)
 
-    # cost function
-    def a_tilde(i, j):
-        return Y[0] - Y[j] - X[i] + D[i] * W[j]
+    # Base case F[j][1] = a(0, j), which is 0 for the nodes 0 and 1
+    initial = instance.cost_row(0)
 
-    # Initialize DP table
-    F = [[float('inf') for _ in range(m+2)] for _ in range(n+2)]
+    layers, _ = monge_dp(n+2, m, initial, None, batch_cost=instance.costs, cumulative=True)
 
-    # Base cases
-    for j in range(0, n+2):
-        F[j][1] = a_tilde(0, j)
+    return layers[m][n+1]
 
-    for k in range(0, m+2):
-        F[1][k] = 0
+"""
+Computes the minimal total latency for placing m proxies among n nodes for B weight scenarios
+on the same line of nodes, running the SMAWK searches of all scenarios in lockstep via
+`smawk_batched`.
 
-    # Lookup Function for computing entries of M^T on demand
-    def lookup(j, i):
-        if i >= j or j < 2:
-            return float('inf')
-        return F[i][k-1] + a_tilde(i, j)
+Parameters:
+    n (int): Number of nodes (excluding v0)
+    m (int): Number of proxies
+    weights (List[List[int]]): Request frequency at each node, one row per scenario
+    distances (List[int]): Distance between consecutive nodes
+
+Returns:
+    np.ndarray: The minimal total latency of each scenario
+"""
+def proxy_problem_batched(n, m, weights, distances):
+    instances = [ProxyInstance(n, scenario, distances) for scenario in weights]
+    num_scenarios = len(instances)
+    D, W, X, Y = (np.stack([getattr(instance, name) for instance in instances]) for name in "DWXY")
+
+    # Initialize DP table, one layer per scenario
+    F = np.full((num_scenarios, n+2, m+2), float('inf'))
+
+    # Base cases
+    F[:, :, 1] = Y[:, :1] - Y - X[:, :1] + D[:, :1] * W
+    F[:, 1, :] = 0
+
+    # Batched lookup function for computing entries of M^T of every scenario on demand
+    def batch_lookup(b, j, i):
+        values = F[b, i, k-1] + (Y[b, 0] - Y[b, j] - X[b, i] + D[b, i] * W[b, j])
+        values[(i >= j) | (j < 2)] = float('inf')
+        return values
 
     # Dynamic Programming via SMAWK
     for k in range(2, m+2):
 
-        # Use SMAWK to find row-minima in M^T
-        minima = smawk_with_lookup(n+2, n+2, lookup)
+        # Use SMAWK to find row-minima in M^T of all scenarios
+        minima, values = smawk_batched(num_scenarios, n+2, n+2, batch_lookup, return_values=True)
 
-        # Update DP Table using minima positions
-        for j in range(2, n+2):
-            F[j][k] = lookup(j, minima[j])
+        # Update DP Table using the row-minima values
+        F[:, 2:, k] = values[:, 2:]
 
-    return F[n+1][m+1]
+    return F[:, n+1, m+1]
 
 if __name__ == "__main__":
     # Example values
@@ -81,4 +105,11 @@ if __name__ == "__main__":
     result2 = proxy_problem(n, m, weights, distances)
 
     print(f"Minimal total latency (m=2): {result1}")
-    print(f"Minimal total latency with no proxies: {result2}")
\ No newline at end of file
+    print(f"Minimal total latency with no proxies: {result2}")
+
+    result3 = proxy_problem_vectorized(n, m, weights, distances)
+    print(f"Minimal total latency (m=2, batched lookup): {result3}")
+
+    scenarios = [weights, weights[::-1], [1] * n]  # What-if weights on the same line
+    result4 = proxy_problem_batched(n, m, scenarios, distances)
+    print(f"Minimal total latency (m=2) of {len(scenarios)} weight scenarios: {result4.tolist()}")
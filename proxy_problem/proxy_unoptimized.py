@@ -1,25 +1,4 @@
-def preprocess_sums(n, distances, weights):
-    distances = [0] + distances + [0]
-    weights = [0] + weights + [0]
-    D = [0] * (n+2)
-    W = [weights[n]] * (n+2)
-    X = [0] * (n+2)
-    Y = [0] *(n+2)
-
-    for j in range(1, n+2):
-        D[j] = D[j-1] + distances[j] 
-
-    for j in range(n, -1, -1):
-        W[j] = W[j+1] + weights[j]
-
-    for j in range(1, n+2):
-        X[j] = X[j-1] + distances[j] * W[j]
-
-    Y[n+1] = weights[n+1] * D[n+1]
-    for j in range(n, -1, -1):
-        Y[j] = Y[j+1] + weights[j]*D[j]
-
-    return D, W, X, Y
+from proxy_problem.proxy_instance import ProxyInstance
 
 """
 Computes the minimal total latency for placing m proxies among n nodes.
@@ -35,11 +14,10 @@ Returns:
 """
 
 def proxy_problem_unoptimized(n, m, weights, distances):
-    D,W,X,Y = preprocess_sums(n, distances, weights)
+    instance = ProxyInstance(n, weights, distances)
 
     # cost function
-    def a_tilde(i,j):
-        return Y[0]-Y[j]-X[i]+D[i]*W[j]
+    a_tilde = instance.cost
 
     # Initialize DP table
     F = [[float('inf') for _ in range(m+2)] for _ in range(n+2)]
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+"""
+Bounded memoization of matrix lookups for `smawk_with_lookup`.
+
+A `LookupCache` is passed to `smawk_with_lookup`, which then memoizes the accesses of every
+recursion level in a separate scope. A scope is dropped when its level returns, so the
+memory held at any time is bounded by the levels on the recursion stack.
+
+Parameters:
+    capacity (int, optional): Maximal number of entries kept per scope.
+        Defaults to the number of rows plus columns of the level.
+    policy (str): Eviction policy once a scope is full, "lru" or "fifo".
+
+Attributes:
+    hits (int): Number of lookups answered from the cache.
+    misses (int): Number of lookups forwarded to the lookup function.
+"""
+
+class LookupCache:
+    def __init__(self, capacity=None, policy="lru"):
+        if policy not in ("lru", "fifo"):
+            raise ValueError(f"Unknown eviction policy: {policy}")
+
+        self.capacity = capacity
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+
+    def scope(self, lookup_function, size):
+        capacity = size if self.capacity is None else self.capacity
+        refresh = self.policy == "lru"
+        entries = OrderedDict()
+
+        def cached_lookup(i, j):
+            key = (i, j)
+            if key in entries:
+                self.hits += 1
+                if refresh:
+                    entries.move_to_end(key)
+                return entries[key]
+
+            self.misses += 1
+            value = lookup_function(i, j)
+            if capacity > 0:
+                if len(entries) >= capacity:
+                    entries.popitem(last=False) # evict least recently used / oldest entry
+                entries[key] = value
+            return value
+
+        return cached_lookup
+
+    def __repr__(self):
+        return f"LookupCache(capacity={self.capacity}, policy={self.policy!r}, hits={self.hits}, misses={self.misses})"
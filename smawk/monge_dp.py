@@ -0,0 +1,157 @@
+import numpy as np
+from smawk.monge_matrix import MongeMatrix
+from smawk.smawk_vectorized import smawk_vectorized
+
+"""
+Solves the layered recurrence
+
+    F[k][j] = min_{i < j} F[k-1][i] + cost(i, j)    for k = 1..num_layers
+
+over the nodes 0..num_nodes-1 for any Monge cost, starting from the layer F[0] = initial.
+Every layer holds the column minima of the `MongeMatrix` M[i][j] = F[k-1][i] + cost(i, j),
+found by one SMAWK search on its transpose, which is totally monotone because adding F[k-1][i]
+to the rows and setting i >= j to infinity keep the cost Monge.
+
+With `cumulative` a node may also keep its value of the previous layer,
+
+    F[k][j] = min(F[k-1][j], min_{i < j} F[k-1][i] + cost(i, j)),
+
+so that F[k] holds the optimum with at most k transitions instead of exactly k. A node that
+keeps its value has itself as argmin.
+
+The cost is either a scalar `cost(i, j)`, searched with `smawk_with_lookup`, or a batched
+`batch_cost(i, j)` on equally long index arrays, searched with `smawk_vectorized`.
+
+Preconditions:
+    - cost(i, j) must be Monge on i < j
+
+Parameters:
+    num_nodes (int): Number of nodes.
+    num_layers (int): Number of layers computed after the initial one.
+    initial (Sequence[float]): The values F[0][j] of the initial layer, infinity for unreachable nodes.
+    cost (Callable[[int, int], float]): Function that returns the cost of the transition from i to j,
+        may be None if `batch_cost` is given.
+    batch_cost (Callable[[np.ndarray, np.ndarray], np.ndarray], optional): Function that returns
+        the costs of the transitions from i[t] to j[t] for all t.
+    cumulative (bool): Let every node keep its value of the previous layer.
+    probe (SmawkProbe, optional): Collects the statistics of every SMAWK search of the scalar engine.
+
+Returns:
+    (List, List): The layers F[0..num_layers] and the argmins, where argmins[k-1][j] is the
+                  leftmost optimal predecessor of node j in layer k. Layers and argmins are lists
+                  for a scalar cost and NumPy arrays for a batched cost.
+"""
+
+def monge_dp(num_nodes, num_layers, initial, cost, batch_cost=None, cumulative=False, probe=None):
+    if batch_cost is not None:
+        return _monge_dp_batched(num_nodes, num_layers, initial, batch_cost, cumulative)
+
+    layers = [list(initial)]
+    argmins = []
+    if num_nodes == 0:
+        return layers + [[] for _ in range(num_layers)], [[] for _ in range(num_layers)]
+
+    previous = layers[0]
+
+    # Lookup Function for computing entries of M on demand
+    def lookup(i, j):
+        if i >= j:
+            return float('inf')
+        return previous[i] + cost(i, j)
+
+    matrix = MongeMatrix(num_nodes, num_nodes, lookup)
+
+    for _ in range(num_layers):
+        minima, values = matrix.column_minima(return_values=True, probe=probe)
+
+        # Keep the previous value where it is not worse
+        if cumulative:
+            for j in range(num_nodes):
+                if previous[j] <= values[j]:
+                    values[j] = previous[j]
+                    minima[j] = j
+
+        layers.append(values)
+        argmins.append(minima)
+        previous = values
+
+    return layers, argmins
+
+
+def _monge_dp_batched(num_nodes, num_layers, initial, batch_cost, cumulative):
+    layers = [np.asarray(initial, dtype=float)]
+    argmins = []
+    if num_nodes == 0:
+        return layers + [np.empty(0) for _ in range(num_layers)], [np.empty(0, dtype=np.intp) for _ in range(num_layers)]
+
+    previous = layers[0]
+    nodes = np.arange(num_nodes)
+
+    # Batched lookup function for computing entries of M on demand
+    def batch_lookup(i, j):
+        values = previous[i] + batch_cost(i, j)
+        values[i >= j] = float('inf')
+        return values
+
+    transposed = MongeMatrix(num_nodes, num_nodes, None, batch_lookup).T
+
+    for _ in range(num_layers):
+        minima, values = smawk_vectorized(num_nodes, num_nodes, transposed.batch, return_values=True)
+
+        # Keep the previous value where it is not worse
+        if cumulative:
+            keep = previous <= values
+            values = np.where(keep, previous, values)
+            minima = np.where(keep, nodes, minima)
+
+        layers.append(values)
+        argmins.append(minima)
+        previous = values
+
+    return layers, argmins
+
+
+"""
+Follows the argmins of `monge_dp` back from a node of the last layer.
+
+Parameters:
+    argmins (List): The argmins returned by `monge_dp`.
+    node (int): Node of the last layer to start from.
+
+Returns:
+    List[int]: The ascending nodes of the optimal path from its node in the initial layer
+               to `node`, a node kept between layers appears once.
+"""
+
+def trace_back(argmins, node):
+    path = []
+    j = int(node)
+    for layer in reversed(argmins):
+        i = int(layer[j])
+        if i != j: # a node that kept its previous value is not a transition
+            path.append(j)
+        j = i
+    path.append(j)
+    path.reverse()
+    return path
+
+
+if __name__ == "__main__":
+    # Example values: split a sequence into 3 segments with the least squared error
+    sequence = [1.0, 1.2, 0.9, 5.1, 4.8, 5.3, 5.0, 9.2, 8.7, 9.1]
+    num_segments = 3
+
+    # Squared error of sequence[i:j] from prefix sums, which is Monge
+    sums = np.concatenate(([0.0], np.cumsum(sequence)))
+    squares = np.concatenate(([0.0], np.cumsum(np.square(sequence))))
+
+    def squared_error(i, j):
+        return squares[j] - squares[i] - (sums[j] - sums[i]) ** 2 / (j - i)
+
+    num_nodes = len(sequence) + 1
+    initial = [0.0] + [float('inf')] * (num_nodes - 1)
+    layers, argmins = monge_dp(num_nodes, num_segments, initial, squared_error)
+
+    boundaries = trace_back(argmins, num_nodes - 1)
+    print(f"Least squared error with {num_segments} segments: {layers[num_segments][num_nodes - 1]:.4f}")
+    print(f"Segments: {[sequence[i:j] for i, j in zip(boundaries, boundaries[1:])]}")
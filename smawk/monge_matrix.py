@@ -0,0 +1,192 @@
+import numpy as np
+from smawk.smawk_with_lookup import smawk_with_lookup
+
+"""
+An implicit Monge matrix whose entries are computed on demand.
+
+A matrix M is Monge if M[i][j] + M[i'][j'] <= M[i][j'] + M[i'][j] for all i < i' and j < j'.
+Its transpose and all of its submatrices are Monge as well, and negating it while reversing
+the column order gives another Monge matrix. Row and column minima and maxima therefore all
+reduce to row minima, which are found by SMAWK on a view of the same entries.
+
+Transposes and submatrices are views that share the entry functions of the original matrix,
+their rows and columns are `range` objects over the original indices. A view is callable with
+(i, j), so it can be passed to `smawk_with_lookup` directly, and `batch` is the batched lookup
+for `smawk_vectorized`. The minima and maxima methods accept the `probe` of `smawk_with_lookup`.
+
+Parameters:
+    num_rows (int): Number of rows in the matrix.
+    num_columns (int): Number of columns in the matrix.
+    lookup_function (Callable[[int, int], float]): Function that returns the value at (i, j),
+        may be None if the matrix is only accessed through `batch`.
+    batch_lookup (Callable[[np.ndarray, np.ndarray], np.ndarray], optional): Function that
+        returns the values at (rows[t], columns[t]) for all t.
+"""
+
+class MongeMatrix:
+    __slots__ = ("_lookup", "_batch_lookup", "_rows", "_columns", "_transposed", "_sign")
+
+    def __init__(self, num_rows, num_columns, lookup_function, batch_lookup=None):
+        self._lookup = lookup_function
+        self._batch_lookup = batch_lookup
+        self._rows = range(num_rows) # original rows (columns if transposed) of the view
+        self._columns = range(num_columns) # original columns (rows if transposed) of the view
+        self._transposed = False
+        self._sign = 1
+
+    # M[i][j] = row_offsets[i] + column_offsets[j] + row_factors[i] * column_factors[j],
+    # which is Monge if the factors are monotone in opposite directions
+    @classmethod
+    def from_prefix_arrays(cls, row_offsets, column_offsets, row_factors, column_factors):
+        R, C, P, Q = (np.asarray(array) for array in (row_offsets, column_offsets, row_factors, column_factors))
+        r, c, p, q = (array.tolist() for array in (R, C, P, Q))
+
+        def lookup(i, j):
+            return r[i] + c[j] + p[i] * q[j]
+
+        def batch_lookup(i, j):
+            return R[i] + C[j] + P[i] * Q[j]
+
+        return cls(len(r), len(c), lookup, batch_lookup)
+
+    # The cost matrix a(i, j) of a proxy instance, for all 0 <= i, j <= n+1
+    @classmethod
+    def from_instance(cls, instance):
+        return cls.from_prefix_arrays(-instance.X, instance.Y[0] - instance.Y, instance.D, instance.W)
+
+    def _view(self, rows, columns, transposed, sign):
+        view = object.__new__(MongeMatrix)
+        view._lookup = self._lookup
+        view._batch_lookup = self._batch_lookup
+        view._rows = rows
+        view._columns = columns
+        view._transposed = transposed
+        view._sign = sign
+        return view
+
+    @property
+    def num_rows(self):
+        return len(self._rows)
+
+    @property
+    def num_columns(self):
+        return len(self._columns)
+
+    @property
+    def shape(self):
+        return len(self._rows), len(self._columns)
+
+    @property
+    def T(self):
+        return self._view(self._columns, self._rows, not self._transposed, self._sign)
+
+    # View on the rows and columns selected by two slices or ranges
+    def submatrix(self, rows, columns):
+        return self._view(_select(self._rows, rows), _select(self._columns, columns), self._transposed, self._sign)
+
+    def __getitem__(self, key):
+        i, j = key
+        if isinstance(i, (slice, range)) or isinstance(j, (slice, range)):
+            i = i if isinstance(i, (slice, range)) else slice(i, i+1)
+            j = j if isinstance(j, (slice, range)) else slice(j, j+1)
+            return self.submatrix(i, j)
+        return self(i, j)
+
+    def __call__(self, i, j):
+        if self._transposed:
+            return self._sign * self._lookup(self._columns[j], self._rows[i])
+        return self._sign * self._lookup(self._rows[i], self._columns[j])
+
+    # Batched lookup for equally long integer arrays of row and column indices
+    def batch(self, i, j):
+        rows = self._rows.start + self._rows.step * np.asarray(i)
+        columns = self._columns.start + self._columns.step * np.asarray(j)
+        if self._transposed:
+            rows, columns = columns, rows
+
+        if self._batch_lookup is None:
+            values = np.array([self._lookup(r, c) for r, c in zip(rows.tolist(), columns.tolist())])
+        else:
+            values = np.asarray(self._batch_lookup(rows, columns))
+        return values if self._sign == 1 else -values
+
+    # Scalar lookup of the view without the indirection of __call__ where possible
+    def lookup_function(self):
+        lookup, rows, columns = self._lookup, self._rows, self._columns
+        if self._sign != 1 or rows.step != 1 or columns.step != 1:
+            return self
+        if rows.start == 0 and columns.start == 0:
+            return (lambda i, j: lookup(j, i)) if self._transposed else lookup
+
+        # Contiguous submatrix, only the offsets of its first row and column are added
+        row_start, column_start = rows.start, columns.start
+        if self._transposed:
+            return lambda i, j: lookup(column_start + j, row_start + i)
+        return lambda i, j: lookup(row_start + i, column_start + j)
+
+    def row_minima(self, return_values=False, probe=None):
+        return smawk_with_lookup(self.num_rows, self.num_columns, self.lookup_function(), return_values=return_values, probe=probe)
+
+    def column_minima(self, return_values=False, probe=None):
+        return self.T.row_minima(return_values, probe)
+
+    # Rightmost maximum of each row, the leftmost minimum of the negated matrix with reversed columns
+    def row_maxima(self, return_values=False, probe=None):
+        reversed_view = self._view(self._rows, self._columns[::-1], self._transposed, -self._sign)
+        result = reversed_view.row_minima(return_values, probe)
+        if result is None:
+            return None
+
+        minima, values = result if return_values else (result, None)
+        last = self.num_columns - 1
+        maxima = [last - j for j in minima]
+        return (maxima, [-value for value in values]) if return_values else maxima
+
+    def column_maxima(self, return_values=False, probe=None):
+        return self.T.row_maxima(return_values, probe)
+
+    def __repr__(self):
+        return f"MongeMatrix(num_rows={self.num_rows}, num_columns={self.num_columns}, transposed={self._transposed})"
+
+
+# Sub-range of `indices` selected by a slice or a range of positions
+def _select(indices, selection):
+    if isinstance(selection, slice):
+        return indices[selection]
+    if len(selection) and not (0 <= min(selection) and max(selection) < len(indices)):
+        raise IndexError(f"{selection} out of bounds for {len(indices)} indices")
+    step = indices.step * selection.step
+    start = indices.start + indices.step * selection.start
+    return range(start, start + step * len(selection), step)
+
+
+if __name__ == "__main__":
+    from proxy_problem.proxy_instance import ProxyInstance
+
+    # Example values
+    matrix = [
+        [25, 21, 13, 10, 20, 13, 19, 35, 37, 41, 58, 66, 82, 99, 124, 133, 156, 178],
+        [42, 35, 26, 20, 29, 21, 25, 37, 36, 39, 56, 64, 76, 91, 116, 125, 146, 164],
+        [57, 48, 35, 28, 33, 24, 28, 40, 37, 37, 54, 61, 72, 83, 107, 113, 131, 146],
+        [78, 65, 51, 42, 44, 35, 38, 48, 42, 42, 55, 61, 70, 80, 100, 106, 120, 135],
+        [90, 76, 58, 48, 49, 39, 42, 48, 39, 35, 47, 51, 56, 63, 80, 86, 97, 110],
+        [103, 85, 67, 56, 55, 44, 44, 49, 39, 33, 41, 44, 49, 56, 71, 75, 84, 96],
+        [123, 105, 86, 75, 73, 59, 57, 62, 51, 44, 50, 52, 55, 59, 72, 74, 80, 92],
+        [142, 123, 100, 86, 82, 65, 61, 62, 50, 43, 47, 45, 46, 46, 58, 59, 65, 73],
+        [151, 130, 104, 88, 80, 59, 52, 49, 37, 29, 29, 24, 23, 20, 28, 25, 31, 39]
+    ]
+
+    monge_matrix = MongeMatrix(len(matrix), len(matrix[0]), lambda i, j: matrix[i][j])
+
+    for name, method in [("Row minima", monge_matrix.row_minima), ("Column minima", monge_matrix.column_minima),
+                         ("Row maxima", monge_matrix.row_maxima), ("Column maxima", monge_matrix.column_maxima)]:
+        print(f"{name:>14}: {method()}")
+
+    # Proxies at nodes 0..3 serving up to the nodes 4..8 of a proxy instance, as a view
+    n = 7  # Number of nodes (excluding v0)
+    weights = [10, 15, 20, 25, 5, 8, 30]  # Weights of the nodes
+    distances = [2, 3, 5, 4, 1, 3, 2]  # Distances between consecutive nodes
+
+    costs = MongeMatrix.from_instance(ProxyInstance(n, weights, distances))[0:4, 4:]
+    rows, values = costs.column_minima(return_values=True)
+    print(f"Best proxy among nodes 0..3 for each of the nodes 4..8: {rows}, costs {values}")
@@ -0,0 +1,178 @@
+import numpy as np
+from smawk.smawk_ndarray import segment_argmin, segment_offsets
+
+"""
+Finds the column index of the minimum value in each row of many totally monotone matrices
+of the same shape at once.
+
+All instances share the recursion skeleton: the same rows are halved on every level, and
+the columns that survive the reduce step are padded with copies of the last surviving column
+so that every instance keeps the same number of columns. A copy never becomes a new leftmost
+minimum, so the padding does not change the result. Each step of the search is then carried
+out for all instances with one NumPy operation, and the interpreter overhead is paid once per
+batch instead of once per instance.
+
+`batch_lookup` receives three equally long integer arrays of instance, row and column indices
+and returns the array of the corresponding matrix values.
+
+Preconditions:
+    - every matrix must be totally monotone
+
+Parameters:
+    num_instances (int): Number of matrices B.
+    num_rows (int): Number of rows of each matrix.
+    num_columns (int): Number of columns of each matrix.
+    batch_lookup (Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]): Function that
+        returns the values at (instances[t], rows[t], columns[t]) for all t.
+    return_values (bool): Also return the minimum value of each row.
+
+Returns:
+    np.ndarray: An integer array of shape (B, num_rows) where entry (b, i) is the column index
+                of the minimum element in row i of matrix b.
+    If `return_values` is set, a tuple (minima, values) where values[b, i] is the
+    minimum of row i of matrix b.
+"""
+
+def smawk_batched(num_instances, num_rows, num_columns, batch_lookup, return_values=False):
+    if num_instances == 0 or num_rows == 0 or num_columns == 0:
+        return None
+
+    instances = np.arange(num_instances)
+    minima = np.empty((num_instances, num_rows), dtype=np.intp) # column index of the row minima of each instance
+
+    rows = np.arange(num_rows)
+    columns = np.broadcast_to(np.arange(num_columns), (num_instances, num_columns)) # columns[b] of instance b
+    levels = [] # (rows, columns) of every interpolate level, outermost first
+
+    # Descend: reduce columns and halve the rows until a single row is left
+    while len(rows) > 1:
+
+        # Reduce
+        if columns.shape[1] > len(rows):
+            columns = _reduce(instances, rows, columns, batch_lookup)
+
+        levels.append((rows, columns))
+        rows = rows[1::2]
+
+    # Base case
+    width = columns.shape[1]
+    values = np.asarray(batch_lookup(np.repeat(instances, width), np.full(num_instances * width, rows[0]), columns.ravel()))
+    values = values.reshape(num_instances, width)
+    base_argmin = values.argmin(axis=1)
+    min_values = np.empty((num_instances, num_rows), dtype=values.dtype)
+    minima[:, rows[0]] = columns[instances, base_argmin]
+    min_values[:, rows[0]] = values[instances, base_argmin]
+
+    # Ascend: interpolate the odd rows of each level in restricted areas
+    for rows, columns in reversed(levels):
+        odd_rows = rows[0::2]
+        even_rows = rows[1::2]
+        width = columns.shape[1]
+
+        # Positions of the even-row minima in the (non-decreasing) columns of each instance,
+        # found with one search over the columns of all instances shifted apart
+        shift = (instances * (num_columns + 1))[:, None]
+        keys = (columns + shift).ravel()
+        even_positions = np.searchsorted(keys, (minima[:, even_rows] + shift).ravel()).reshape(num_instances, -1)
+        even_positions -= (instances * width)[:, None]
+
+        lower_bounds = np.zeros((num_instances, len(odd_rows)), dtype=np.intp)
+        upper_bounds = np.full((num_instances, len(odd_rows)), width - 1, dtype=np.intp)
+        lower_bounds[:, 1:] = even_positions[:, :len(odd_rows) - 1]
+        upper_bounds[:, :len(even_rows)] = even_positions
+
+        # Evaluate the windows of all instances with a single batched lookup
+        lengths = (upper_bounds - lower_bounds + 1).ravel()
+        offsets = segment_offsets(lengths)
+        window_instances = np.repeat(np.repeat(instances, len(odd_rows)), lengths)
+        window_positions = np.repeat(lower_bounds.ravel(), lengths) + offsets
+        values = batch_lookup(window_instances, np.repeat(np.tile(odd_rows, num_instances), lengths),
+                              columns[window_instances, window_positions])
+
+        window_argmin, window_minima = segment_argmin(np.asarray(values), lengths)
+        positions = lower_bounds + window_argmin.reshape(num_instances, -1)
+        minima[:, odd_rows] = np.take_along_axis(columns, positions, axis=1)
+        min_values[:, odd_rows] = window_minima.reshape(num_instances, -1)
+
+    return (minima, min_values) if return_values else minima
+
+
+def _reduce(instances, rows, columns, batch_lookup):
+    num_instances, num_columns = columns.shape
+    num_rows = len(rows)
+    stack = np.empty((num_instances, num_rows), dtype=np.intp) # surviving columns of each instance
+    stack_values = None # stack_values[b, p] = matrix[b, rows[p], stack[b, p]]
+    depth = np.zeros(num_instances, dtype=np.intp) # stack size of each instance
+
+    for t in range(num_columns):
+        j = columns[:, t]
+
+        # Pop while the stack top is strictly larger than j in its row, in all instances at once
+        active = np.flatnonzero(depth)
+        while len(active):
+            top = depth[active] - 1
+            values = np.asarray(batch_lookup(active, rows[top], j[active]))
+            pop = stack_values[active, top] > values
+            active = active[pop]
+            depth[active] -= 1
+            active = active[depth[active] > 0]
+
+        # Push j where the stack is not full
+        push = np.flatnonzero(depth < num_rows)
+        values = np.asarray(batch_lookup(push, rows[depth[push]], j[push]))
+        if stack_values is None:
+            stack_values = np.empty((num_instances, num_rows), dtype=values.dtype)
+        stack[push, depth[push]] = j[push]
+        stack_values[push, depth[push]] = values
+        depth[push] += 1
+
+    # Pad every stack to the same width with copies of its last column
+    width = depth.max()
+    positions = np.minimum(np.arange(width), (depth - 1)[:, None])
+    return np.take_along_axis(stack, positions, axis=1)
+
+
+"""
+Finds the column index of the minimum value in each row of every matrix of a 3-D NumPy array.
+
+Preconditions:
+    - every matrix `matrices[b]` must be totally monotone
+
+Parameters:
+    matrices (np.ndarray): 3-D array of shape B × r × c.
+    return_values (bool): Also return the minimum value of each row.
+
+Returns:
+    np.ndarray: An integer array of shape (B, r), see `smawk_batched`.
+"""
+
+def smawk_batched_ndarray(matrices, return_values=False):
+    matrices = np.asarray(matrices)
+
+    def batch_lookup(instances, rows, columns):
+        return matrices[instances, rows, columns]
+
+    return smawk_batched(*matrices.shape, batch_lookup, return_values=return_values)
+
+if __name__ == "__main__":
+    # Example values
+    matrix = np.array([
+        [25, 21, 13, 10, 20, 13, 19, 35, 37, 41, 58, 66, 82, 99, 124, 133, 156, 178],
+        [42, 35, 26, 20, 29, 21, 25, 37, 36, 39, 56, 64, 76, 91, 116, 125, 146, 164],
+        [57, 48, 35, 28, 33, 24, 28, 40, 37, 37, 54, 61, 72, 83, 107, 113, 131, 146],
+        [78, 65, 51, 42, 44, 35, 38, 48, 42, 42, 55, 61, 70, 80, 100, 106, 120, 135],
+        [90, 76, 58, 48, 49, 39, 42, 48, 39, 35, 47, 51, 56, 63, 80, 86, 97, 110],
+        [103, 85, 67, 56, 55, 44, 44, 49, 39, 33, 41, 44, 49, 56, 71, 75, 84, 96],
+        [123, 105, 86, 75, 73, 59, 57, 62, 51, 44, 50, 52, 55, 59, 72, 74, 80, 92],
+        [142, 123, 100, 86, 82, 65, 61, 62, 50, 43, 47, 45, 46, 46, 58, 59, 65, 73],
+        [151, 130, 104, 88, 80, 59, 52, 49, 37, 29, 29, 24, 23, 20, 28, 25, 31, 39]
+    ])
+
+    # The matrix and two copies with linear column offsets, which stay totally monotone
+    column_offsets = np.arange(matrix.shape[1]) * 3
+    matrices = np.stack([matrix, matrix + column_offsets, matrix - column_offsets])
+
+    minima_indices = smawk_batched_ndarray(matrices)
+
+    for b, minima in enumerate(minima_indices):
+        print(f"Instance {b}: row minima at columns {minima.tolist()}")
@@ -0,0 +1,174 @@
+import random
+from smawk.smawk_with_lookup import smawk_with_lookup
+
+"""
+Tests whether the 2x2 minor on rows r1 < r2 and columns c1 < c2 violates total monotonicity,
+i.e. whether the leftmost minimum of row r1 lies right of the leftmost minimum of row r2.
+
+Parameters:
+    lookup_function (Callable[[int, int], float]): Function that returns the value at (i, j).
+    rows (Tuple[int, int]): Rows r1 < r2 of the minor.
+    columns (Tuple[int, int]): Columns c1 < c2 of the minor.
+
+Returns:
+    bool: True if the minor is not monotone.
+"""
+
+def is_violating_minor(lookup_function, rows, columns):
+    (r1, r2), (c1, c2) = rows, columns
+    return lookup_function(r1, c2) < lookup_function(r1, c1) and lookup_function(r2, c1) <= lookup_function(r2, c2)
+
+
+"""
+Checks row minima computed under the assumption of total monotonicity without scanning the matrix.
+
+The check walks the argmin staircase, where consecutive minima must not decrease, and tests
+the 2x2 minor of every two adjacent rows on their claimed minimum columns, which costs 2(r-1)
+lookups. It then compares the claimed minimum of `samples` random rows against a random column.
+When a row minimum turns out to be wrong, the minors it forms with the minima of its neighbouring
+rows are searched for the violation.
+
+A reported violation is always genuine. Violations on the answer path are always found, the
+others only by the sampling: if B entries of the matrix beat the claimed minimum of their row,
+all of them are missed with probability (1 - B / (r c))^samples, about exp(-samples B / (r c)).
+With the default of r/4 samples a single wrong entry is missed with probability about
+exp(-1 / (4c)), so the sampling only reliably catches matrices that are far from monotone.
+
+Parameters:
+    num_rows (int): Number of rows in the matrix.
+    num_columns (int): Number of columns in the matrix.
+    lookup_function (Callable[[int, int], float]): Function that returns the value at (i, j).
+    minima (List[int]): Claimed column index of the minimum of each row.
+    values (List[float]): Claimed minimum of each row.
+    samples (int, optional): Number of sampled entries, defaults to a quarter of the rows.
+    seed (int, optional): Seed of the sampling.
+
+Returns:
+    Tuple[Tuple[int, ...], Tuple[int, int]] or None: None if no violation was found. Otherwise
+        the rows (r1, r2) and columns (c1, c2) of a violating minor, or, if only a wrong row
+        minimum was found, the row (r,) with its claimed column c and a column j that beats it.
+"""
+
+def find_violation(num_rows, num_columns, lookup_function, minima, values, samples=None, seed=None):
+    # Staircase: the minima of a totally monotone matrix are non-decreasing
+    for i in range(num_rows - 1):
+        if minima[i] > minima[i+1]:
+            minor = ((i, i+1), (minima[i+1], minima[i]))
+            if is_violating_minor(lookup_function, *minor):
+                return minor
+
+            # Otherwise one of the two claimed minima is beaten by the other column
+            if lookup_function(i, minima[i+1]) <= values[i]:
+                return (i,), (minima[i], minima[i+1])
+            return (i+1,), (minima[i+1], minima[i])
+
+    # Answer path: no row may prefer the claimed minimum of the row below or above it
+    for i in range(num_rows - 1):
+        c1, c2 = minima[i], minima[i+1]
+        if c1 == c2:
+            continue
+        upper_beaten = lookup_function(i, c2) < values[i]
+        lower_beaten = lookup_function(i+1, c1) <= values[i+1]
+        if upper_beaten and lower_beaten:
+            return (i, i+1), (c1, c2)
+        if upper_beaten:
+            return (i,), (c1, c2)
+        if lower_beaten:
+            return (i+1,), (c2, c1)
+
+    if samples is None:
+        samples = max(1, num_rows // 4)
+    rng = random.Random(seed)
+
+    # Sampled entries along the staircase
+    for _ in range(samples):
+        i = rng.randrange(num_rows)
+        j = rng.randrange(num_columns)
+        value = lookup_function(i, j)
+        if value < values[i] or (value == values[i] and j < minima[i]):
+            # Row i prefers column j, look for a neighbour that prefers its own minimum
+            for r in (i-1, i+1):
+                if 0 <= r < num_rows and minima[r] != j:
+                    minor = (tuple(sorted((i, r))), tuple(sorted((j, minima[r]))))
+                    if is_violating_minor(lookup_function, *minor):
+                        return minor
+            return (i,), (minima[i], j)
+
+    return None
+
+
+"""
+Finds the column index of the minimum value in each row of a matrix that is expected,
+but not guaranteed, to be totally monotone.
+
+The minima are computed with `smawk_with_lookup` and checked by `find_violation`, whose cost
+is a small fraction of the search. If the check finds a violation, the minima are recomputed
+by an exact scan of every row, which costs r c lookups. With `max_scan` set, matrices of more
+than `max_scan` entries skip the scan and keep the minima of the search, so that the call
+stays within O(r + c) lookups and the caller decides what to do with the reported violation.
+
+Parameters:
+    num_rows (int): Number of rows in the matrix.
+    num_columns (int): Number of columns in the matrix.
+    lookup_function (Callable[[int, int], float]): Function that returns the value at (i, j).
+    samples (int, optional): Number of sampled entries, defaults to a quarter of the rows.
+    seed (int, optional): Seed of the sampling.
+    return_values (bool): Also return the minimum value of each row.
+    max_scan (int, optional): Largest number of entries of the exact scan, unbounded by default.
+
+Returns:
+    (List[int], violation): The column index of the minimum of each row and the violation
+        reported by `find_violation`, None if the check passed. The minima are exact if a
+        violation was reported, unless the matrix has more than `max_scan` entries.
+    If `return_values` is set, a tuple (minima, values, violation).
+"""
+
+def smawk_checked(num_rows, num_columns, lookup_function, samples=None, seed=None, return_values=False, max_scan=None):
+    if num_rows == 0 or num_columns == 0:
+        return (None, None, None) if return_values else (None, None)
+
+    minima, values = smawk_with_lookup(num_rows, num_columns, lookup_function, return_values=True)
+    violation = find_violation(num_rows, num_columns, lookup_function, minima, values, samples, seed)
+
+    # Fall back to the exact scan unless it exceeds the optional bound
+    if violation is not None and (max_scan is None or num_rows * num_columns <= max_scan):
+        for i in range(num_rows):
+            min_value = lookup_function(i, 0)
+            min_column = 0
+            for j in range(1, num_columns):
+                value = lookup_function(i, j)
+                if value < min_value:
+                    min_value = value
+                    min_column = j
+            minima[i] = min_column
+            values[i] = min_value
+
+    return (minima, values, violation) if return_values else (minima, violation)
+
+if __name__ == "__main__":
+    # Example values
+    matrix = [
+        [25, 21, 13, 10, 20, 13, 19, 35, 37, 41, 58, 66, 82, 99, 124, 133, 156, 178],
+        [42, 35, 26, 20, 29, 21, 25, 37, 36, 39, 56, 64, 76, 91, 116, 125, 146, 164],
+        [57, 48, 35, 28, 33, 24, 28, 40, 37, 37, 54, 61, 72, 83, 107, 113, 131, 146],
+        [78, 65, 51, 42, 44, 35, 38, 48, 42, 42, 55, 61, 70, 80, 100, 106, 120, 135],
+        [90, 76, 58, 48, 49, 39, 42, 48, 39, 35, 47, 51, 56, 63, 80, 86, 97, 110],
+        [103, 85, 67, 56, 55, 44, 44, 49, 39, 33, 41, 44, 49, 56, 71, 75, 84, 96],
+        [123, 105, 86, 75, 73, 59, 57, 62, 51, 44, 50, 52, 55, 59, 72, 74, 80, 92],
+        [142, 123, 100, 86, 82, 65, 61, 62, 50, 43, 47, 45, 46, 46, 58, 59, 65, 73],
+        [151, 130, 104, 88, 80, 59, 52, 49, 37, 29, 29, 24, 23, 20, 28, 25, 31, 39]
+    ]
+
+    num_rows = len(matrix)
+    num_columns = len(matrix[0])
+
+    def lookup(i, j):
+        return matrix[i][j]
+
+    minima_indices, violation = smawk_checked(num_rows, num_columns, lookup, samples=num_rows)
+    print(f"Totally monotone matrix: minima {minima_indices}, violation {violation}")
+
+    # A row measured in reverse order breaks total monotonicity
+    matrix[7].reverse()
+    minima_indices, violation = smawk_checked(num_rows, num_columns, lookup, samples=num_rows, seed=0)
+    print(f"Perturbed matrix: minima {minima_indices}, violation {violation}")
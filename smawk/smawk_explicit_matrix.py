@@ -1,18 +1,30 @@
+from smawk.smawk_ndarray import smawk_ndarray
+
 """
 Finds the column index of the minimum value in each row of a totally monotone matrix.
 
 Preconditions:
     - `matrix` must be totally monotone
 
+A matrix that is not a list of lists, such as an `np.memmap` or any other 2-D buffer, is
+searched by `smawk_buffer` without copying it.
+
 Parameters:
-    matrix (List[List[float]]): matrix of size r × c.
+    matrix (List[List[float]] | np.ndarray): matrix of size r × c.
+    return_values (bool): Also return the minimum value of each row.
+    probe (SmawkProbe, optional): Collects matrix reads, comparisons and timings of every recursion level.
 
 Returns:
     List[int]: A list of length `r` where the i-th entry is the column index 
                 of the minimum element in row i.
+    If `return_values` is set, a tuple (minima, values) where values[i] is the
+    minimum of row i.
 """
 
-def smawk(matrix):
+def smawk(matrix, return_values=False, probe=None):
+    if not isinstance(matrix, (list, tuple)):
+        return smawk_buffer(matrix, return_values, probe)
+
     num_rows = len(matrix)
     num_columns = len(matrix[0])
 
@@ -20,6 +32,13 @@ def smawk(matrix):
         return None
 
     minima = [None] * num_rows # will store the column index of row minimum for each row
+    values = [None] * num_rows # will store the minimum value of each row
+
+    # Sub-matrices are built from the uncounted entries
+    entries = matrix
+    if probe is not None:
+        level = probe.enter(num_rows, num_columns)
+        matrix = probe.counted_rows(matrix, level)
 
     # Base Case
     if num_rows == 1:
@@ -30,7 +49,10 @@ def smawk(matrix):
                 min_value = matrix[0][j]
                 min_column = j
         minima[0] = min_column
-        return minima
+        values[0] = min_value
+        if probe is not None:
+            probe.exit(level, "base", num_rows, num_columns, num_columns - 1)
+        return (minima, values) if return_values else minima
 
     # Reduce
     if num_columns > num_rows:
@@ -42,10 +64,11 @@ def smawk(matrix):
             if len(stack) < num_rows:
                 stack.append(j)
         reduced_columns = stack
+        phase = "reduce"
 
         # Recursive SMAWK Call on reduced matrix
-        reduced_minima = smawk(
-            [[matrix[i][j] for j in reduced_columns] for i in range(num_rows)]
+        reduced_minima, values = smawk(
+            [[entries[i][j] for j in reduced_columns] for i in range(num_rows)], True, probe
         )
 
         # Map reduced map minima back to original column indices
@@ -58,13 +81,14 @@ def smawk(matrix):
         odd_rows = list(range(0, num_rows, 2))
 
         # Recursive SMAWK Call on even rows
-        reduced_minima = smawk(
-            [matrix[i] for i in even_rows]
+        reduced_minima, reduced_values = smawk(
+            [entries[i] for i in even_rows], True, probe
         )
 
         # Map reduced minima back to original column indices
         for idx, row in enumerate(even_rows):
             minima[row] = reduced_minima[idx]
+            values[row] = reduced_values[idx]
 
         # Compute minima for odd rows vial linear search in restricted area
         for row in odd_rows:
@@ -79,10 +103,54 @@ def smawk(matrix):
                     min_value = matrix[row][j]
                     min_column = j
             minima[row] = min_column
+            values[row] = min_value
+        phase = "interpolate"
+
+    if probe is not None:
+        # Each reduce comparison reads two entries
+        comparisons = level[0] // 2 if phase == "reduce" else probe.interpolate_comparisons(minima, num_columns)
+        probe.exit(level, phase, num_rows, num_columns, comparisons)
+
+    return (minima, values) if return_values else minima
+
+
+"""
+Finds the column index of the minimum value in each row of a totally monotone matrix stored
+in a 2-D buffer, such as an `np.memmap` of a matrix on disk.
+
+The buffer is searched in place by `smawk_ndarray`, which never builds sub-matrices and reads
+only the O(r + c) entries SMAWK needs, in row-major order. The argmins and values are the
+same as those of `smawk` on the matrix as nested lists. The read-ahead of the kernel can still load far more of a memory-mapped
+file than is read, a mapping advised as `mmap.MADV_RANDOM` only loads the pages touched.
+
+Preconditions:
+    - `matrix` must be totally monotone
 
-    return minima
+Parameters:
+    matrix (np.ndarray | memoryview): 2-D buffer of size r × c, it is not copied.
+    return_values (bool): Also return the minimum value of each row.
+    probe (SmawkProbe, optional): Collects matrix reads, comparisons and timings of every recursion level.
+
+Returns:
+    List[int]: A list of length `r` where the i-th entry is the column index
+                of the minimum element in row i.
+    If `return_values` is set, a tuple (minima, values) where values[i] is the
+    minimum of row i.
+"""
+
+def smawk_buffer(matrix, return_values=False, probe=None):
+    result = smawk_ndarray(matrix, return_values=True, probe=probe)
+    if result is None:
+        return None
+
+    minima, values = (array.tolist() for array in result)
+    return (minima, values) if return_values else minima
 
 if __name__ == "__main__":
+    import tempfile
+    import numpy as np
+    from smawk.smawk_probe import SmawkProbe
+
     # Example values
     matrix = [
             [25, 21, 13, 10, 20, 13, 19, 35, 37, 41, 58, 66, 82, 99, 124, 133, 156, 178],
@@ -99,4 +167,17 @@ if __name__ == "__main__":
     minima = smawk(matrix)
     print("Row minima indices:")
     for i, col in enumerate(minima):
-        print(f"Row {i}: min at column {col} (value = {matrix[i][col]})")
\ No newline at end of file
+        print(f"Row {i}: min at column {col} (value = {matrix[i][col]})")
+
+    # Same search with statistics per recursion level
+    probe = SmawkProbe()
+    assert smawk(matrix, probe=probe) == minima
+    print(probe)
+
+    # Same search on the matrix stored in a file, which is read through a memory map
+    with tempfile.TemporaryFile() as file:
+        np.asarray(matrix, dtype=np.int64).tofile(file)
+        file.flush()
+        mapped = np.memmap(file, dtype=np.int64, mode="r", shape=(len(matrix), len(matrix[0])))
+        assert smawk(mapped, return_values=True) == smawk(matrix, return_values=True)
+        print(f"Memory-mapped search: {smawk(mapped)}")
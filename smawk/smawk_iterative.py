@@ -0,0 +1,101 @@
+"""
+Finds the column index of the minimum value in each row of a totally monotone matrix.
+
+Iterative variant of `smawk_with_lookup`: every level keeps explicit lists of the
+original row and column indices it works on, so each matrix access is a single call
+of `lookup_function` on original coordinates, without a chain of wrapping closures.
+
+Preconditions:
+    - `matrix` must be totally monotone
+
+Parameters:
+    num_rows (int): Number of rows in the matrix.
+    num_columns (int): Number of columns in the matrix.
+    lookup_function (Callable[[int, int], float]): Function that returns the value at (i, j).
+
+Returns:
+    List[int]: A list where the i-th entry is the column index
+                of the minimum element in row i.
+"""
+
+def smawk_iterative(num_rows, num_columns, lookup_function):
+    if num_rows == 0 or num_columns == 0:
+        return None
+
+    minima = [None] * num_rows # will store the column index of row minimum for each row
+
+    rows = list(range(num_rows))
+    columns = list(range(num_columns))
+    levels = [] # (rows, columns) of every interpolate level, outermost first
+
+    # Descend: reduce columns and halve the rows until a single row is left
+    while len(rows) > 1:
+
+        # Reduce
+        if len(columns) > len(rows):
+            stack = []
+            for j in columns:
+                while stack and lookup_function(rows[len(stack) - 1], stack[-1]) > lookup_function(rows[len(stack) - 1], j):
+                    stack.pop()
+                if len(stack) < len(rows):
+                    stack.append(j)
+            columns = stack
+
+        levels.append((rows, columns))
+        rows = rows[1::2]
+
+    # Base case
+    row = rows[0]
+    min_value = lookup_function(row, columns[0])
+    min_column = columns[0]
+    for j in columns[1:]:
+        value = lookup_function(row, j)
+        if value < min_value:
+            min_value = value
+            min_column = j
+    minima[row] = min_column
+
+    # Ascend: interpolate the odd rows of each level in restricted areas
+    for rows, columns in reversed(levels):
+        position = 0 # position of the current lower bound in `columns`
+        for idx in range(0, len(rows), 2):
+            row = rows[idx]
+            upper_bound = minima[rows[idx + 1]] if idx + 1 < len(rows) else columns[-1]
+
+            min_value = lookup_function(row, columns[position])
+            min_column = columns[position]
+            while columns[position] < upper_bound:
+                position += 1
+                value = lookup_function(row, columns[position])
+                if value < min_value:
+                    min_value = value
+                    min_column = columns[position]
+            minima[row] = min_column
+
+    return minima
+
+if __name__ == "__main__":
+    # Example values
+    matrix = [
+        [25, 21, 13, 10, 20, 13, 19, 35, 37, 41, 58, 66, 82, 99, 124, 133, 156, 178],
+        [42, 35, 26, 20, 29, 21, 25, 37, 36, 39, 56, 64, 76, 91, 116, 125, 146, 164],
+        [57, 48, 35, 28, 33, 24, 28, 40, 37, 37, 54, 61, 72, 83, 107, 113, 131, 146],
+        [78, 65, 51, 42, 44, 35, 38, 48, 42, 42, 55, 61, 70, 80, 100, 106, 120, 135],
+        [90, 76, 58, 48, 49, 39, 42, 48, 39, 35, 47, 51, 56, 63, 80, 86, 97, 110],
+        [103, 85, 67, 56, 55, 44, 44, 49, 39, 33, 41, 44, 49, 56, 71, 75, 84, 96],
+        [123, 105, 86, 75, 73, 59, 57, 62, 51, 44, 50, 52, 55, 59, 72, 74, 80, 92],
+        [142, 123, 100, 86, 82, 65, 61, 62, 50, 43, 47, 45, 46, 46, 58, 59, 65, 73],
+        [151, 130, 104, 88, 80, 59, 52, 49, 37, 29, 29, 24, 23, 20, 28, 25, 31, 39]
+    ]
+
+    num_rows = len(matrix)
+    num_columns = len(matrix[0])
+
+    def lookup(i, j):
+        return matrix[i][j]
+
+    minima_indices = smawk_iterative(num_rows, num_columns, lookup)
+
+    for i, col in enumerate(minima_indices):
+        val = matrix[i][col]
+        print(f"Row {i:2}: min at column {col:2} (value = {val})")
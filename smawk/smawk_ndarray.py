@@ -0,0 +1,179 @@
+import numpy as np
+
+"""
+Finds the column index of the minimum value in each row of a totally monotone matrix
+given as a 2-D NumPy array.
+
+Instead of building sub-matrices on every recursion level, the recursion works on
+arrays of row and column indices into the original array. The odd-row searches of
+the interpolate step are evaluated as one vectorized gather over all restricted windows.
+
+Only the entries SMAWK compares are read, so `matrix` may be an `np.memmap` or any other 2-D
+buffer that is not copied. Reads are row-major: the reduce step walks the columns in increasing
+order and only moves between neighbouring rows, and the windows of the interpolate step are
+gathered row by row, each in increasing column order.
+
+Preconditions:
+    - `matrix` must be totally monotone
+
+Parameters:
+    matrix (np.ndarray): 2-D array of size r × c.
+    return_values (bool): Also return the minimum value of each row.
+    probe (SmawkProbe, optional): Collects matrix reads, comparisons and timings of every recursion level.
+
+Returns:
+    np.ndarray: An integer array of length `r` where the i-th entry is the column index
+                of the minimum element in row i.
+    If `return_values` is set, a tuple (minima, values) where values[i] is the
+    minimum of row i.
+"""
+
+def smawk_ndarray(matrix, return_values=False, probe=None):
+    matrix = np.asarray(matrix) # a view of a buffer, nothing is read yet
+    num_rows, num_columns = matrix.shape
+
+    if num_rows == 0 or num_columns == 0:
+        return None
+
+    rows = np.arange(num_rows)
+    columns = np.arange(num_columns)
+    minima, values = _smawk(matrix, rows, columns, probe)
+    return (minima, values) if return_values else minima
+
+
+"""
+Computes the minimum of each segment of `values`, where segment s has length `lengths[s]`.
+
+Parameters:
+    values (np.ndarray): Concatenation of all segments.
+    lengths (np.ndarray): Positive length of each segment.
+
+Returns:
+    (np.ndarray, np.ndarray): Offset of the leftmost minimum inside each segment
+                              and the minimum value of each segment.
+"""
+
+def segment_argmin(values, lengths):
+    starts = np.zeros(len(lengths), dtype=np.intp)
+    np.cumsum(lengths[:-1], out=starts[1:])
+
+    segment_minima = np.minimum.reduceat(values, starts)
+
+    # Leftmost position in each segment that attains the segment minimum
+    is_minimum = values == np.repeat(segment_minima, lengths)
+    positions = np.flatnonzero(is_minimum)
+    segment_ids = np.repeat(np.arange(len(lengths)), lengths)[positions]
+    _, first = np.unique(segment_ids, return_index=True)
+
+    return positions[first] - starts, segment_minima
+
+
+"""
+Computes the offset of every position inside its segment, where segment s has length `lengths[s]`.
+
+Parameters:
+    lengths (np.ndarray): Length of each segment.
+
+Returns:
+    np.ndarray: An array of length `lengths.sum()` holding 0, 1, ..., lengths[s] - 1 for every segment s.
+"""
+
+def segment_offsets(lengths):
+    return np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+
+# Row minima columns and values of the sub-matrix given by the rows and columns index arrays
+def _smawk(matrix, rows, columns, probe):
+    num_rows = len(rows)
+    num_columns = len(columns)
+
+    if probe is not None:
+        level = probe.enter(num_rows, num_columns)
+
+    # Base case
+    if num_rows == 1:
+        row_values = matrix[rows[0], columns]
+        position = np.argmin(row_values)
+        if probe is not None:
+            level[0] += num_columns
+            probe.exit(level, "base", num_rows, num_columns, num_columns - 1)
+        return columns[[position]], row_values[[position]]
+
+    # Reduce, the value of the top of the stack is kept so that every comparison reads one entry
+    if num_columns > num_rows:
+        row_list = rows.tolist()
+        stack = []
+        stack_values = []
+        reads = 0
+        comparisons = 0
+        for j in columns.tolist():
+            while stack:
+                value = matrix.item(row_list[len(stack) - 1], j)
+                reads += 1
+                comparisons += 1
+                if stack_values[-1] > value:
+                    stack.pop()
+                    stack_values.pop()
+                else:
+                    break
+            if len(stack) < num_rows:
+                stack_values.append(matrix.item(row_list[len(stack)], j))
+                reads += 1
+                stack.append(j)
+
+        # Recursive SMAWK Call on reduced column index set
+        minima, values = _smawk(matrix, rows, np.array(stack), probe)
+        if probe is not None:
+            level[0] += reads
+            probe.exit(level, "reduce", num_rows, num_columns, comparisons)
+        return minima, values
+
+    # Interpolate
+    minima = np.empty(num_rows, dtype=columns.dtype)
+    values = np.empty(num_rows, dtype=matrix.dtype)
+
+    # Recursive SMAWK Call on even rows
+    minima[1::2], values[1::2] = _smawk(matrix, rows[1::2], columns, probe)
+
+    # Restricted windows [lower_bound, upper_bound] of the odd rows as positions in `columns`
+    even_positions = np.searchsorted(columns, minima[1::2])
+    num_odd = len(range(0, num_rows, 2))
+    lower_bounds = np.empty(num_odd, dtype=np.intp)
+    upper_bounds = np.empty(num_odd, dtype=np.intp)
+    lower_bounds[0] = 0
+    lower_bounds[1:] = even_positions[:num_odd - 1]
+    upper_bounds[:len(even_positions)] = even_positions
+    upper_bounds[len(even_positions):] = num_columns - 1
+
+    # Gather all windows row by row, the windows are consecutive and increasing
+    lengths = upper_bounds - lower_bounds + 1
+    offsets = segment_offsets(lengths)
+    window_positions = np.repeat(lower_bounds, lengths) + offsets
+    window_values = matrix[np.repeat(rows[0::2], lengths), columns[window_positions]]
+
+    window_argmin, values[0::2] = segment_argmin(window_values, lengths)
+    minima[0::2] = columns[lower_bounds + window_argmin]
+
+    if probe is not None:
+        level[0] += len(window_values)
+        probe.exit(level, "interpolate", num_rows, num_columns, int((lengths - 1).sum()))
+    return minima, values
+
+if __name__ == "__main__":
+    # Example values
+    matrix = np.array([
+            [25, 21, 13, 10, 20, 13, 19, 35, 37, 41, 58, 66, 82, 99, 124, 133, 156, 178],
+            [42, 35, 26, 20, 29, 21, 25, 37, 36, 39, 56, 64, 76, 91, 116, 125, 146, 164],
+            [57, 48, 35, 28, 33, 24, 28, 40, 37, 37, 54, 61, 72, 83, 107, 113, 131, 146],
+            [78, 65, 51, 42, 44, 35, 38, 48, 42, 42, 55, 61, 70, 80, 100, 106, 120, 135],
+            [90, 76, 58, 48, 49, 39, 42, 48, 39, 35, 47, 51, 56, 63, 80, 86, 97, 110],
+            [103, 85, 67, 56, 55, 44, 44, 49, 39, 33, 41, 44, 49, 56, 71, 75, 84, 96],
+            [123, 105, 86, 75, 73, 59, 57, 62, 51, 44, 50, 52, 55, 59, 72, 74, 80, 92],
+            [142, 123, 100, 86, 82, 65, 61, 62, 50, 43, 47, 45, 46, 46, 58, 59, 65, 73],
+            [151, 130, 104, 88, 80, 59, 52, 49, 37, 29, 29, 24, 23, 20, 28, 25, 31, 39]
+        ])
+
+    minima = smawk_ndarray(matrix)
+    print("Row minima indices:")
+    for i, col in enumerate(minima):
+        print(f"Row {i}: min at column {col} (value = {matrix[i][col]})")
@@ -0,0 +1,158 @@
+from smawk.smawk_with_lookup import smawk_with_lookup
+
+"""
+Computes the column minima E[j] = min_{i < j} M[i][j] of an upper-triangular totally monotone
+matrix whose row i may depend on E[i], so that the columns become known one at a time.
+
+This is the recurrence E[j] = min_{i < j} E[i] + w(i, j) of a Monge cost w, which the offline
+SMAWK cannot solve since row i only exists once column i is finished. Following Galil and Park
+in the formulation by Eppstein, the columns are finished in order with amortized O(1) lookups
+each. The rows base..finished are searched by `smawk_with_lookup` on the largest square block
+of columns after `finished`, which gives tentative minima for columns up to `tentative`.
+Every later row either finishes one more column with at most two lookups or moves the base
+past rows that cannot supply any later minimum, and the work of the discarded block is charged
+to that move. Ties go to the smaller row, so the minima are leftmost as in `smawk_with_lookup`.
+
+Preconditions:
+    - M must be totally monotone on i < j, e.g. Monge
+    - lookup_function(i, j) may only use the minima of the columns up to i
+
+Parameters:
+    num_columns (int): Number of columns of the matrix, column 0 is given by `initial`.
+    lookup_function (Callable[[int, int], float]): Function that returns the value at (i, j) for i < j.
+    initial (float): The value E[0].
+
+Attributes:
+    values (List[float]): The minimum of every column computed so far, final up to `finished`.
+    indices (List[int]): The leftmost row of that minimum, None for column 0.
+    finished (int): The last column whose minimum is final.
+"""
+
+class OnlineMonotoneMinima:
+    __slots__ = ("values", "indices", "finished", "_lookup", "_num_columns", "_base", "_tentative")
+
+    def __init__(self, num_columns, lookup_function, initial):
+        self.values = [initial]
+        self.indices = [None]
+        self.finished = 0
+        self._lookup = lookup_function
+        self._num_columns = num_columns
+        self._base = 0 # no row before the base supplies a minimum after `finished`
+        self._tentative = 0 # last column with a tentative minimum
+
+    # Final minimum of column j
+    def value(self, j):
+        while self.finished < j:
+            self._advance()
+        return self.values[j]
+
+    # Leftmost row of the final minimum of column j
+    def index(self, j):
+        while self.finished < j:
+            self._advance()
+        return self.indices[j]
+
+    # Finishes column `finished` + 1
+    def _advance(self):
+        i = self.finished
+        lookup = self._lookup
+        values = self.values
+        indices = self.indices
+
+        # Tentative minima used up: search the rows base..i on the square block of columns after i
+        if i >= self._tentative:
+            base = self._base
+            self._tentative = min(i + (i - base + 1), self._num_columns - 1)
+            first = i + 1
+
+            # Column minima of the block are the row minima of its transpose
+            def block_lookup(j, row):
+                return lookup(base + row, first + j)
+
+            minima, block_values = smawk_with_lookup(self._tentative - i, i - base + 1, block_lookup, return_values=True)
+            for j, (row, value) in enumerate(zip(minima, block_values), first):
+                if j >= len(values):
+                    values.append(value)
+                    indices.append(base + row)
+                elif value < values[j] or (value == values[j] and base + row < indices[j]):
+                    values[j] = value
+                    indices[j] = base + row
+            self.finished = first
+            return
+
+        # The minimum of column i+1 is on the diagonal, so row i beats all earlier rows
+        # on every later column and the tentative minima are dropped
+        diagonal = lookup(i, i + 1)
+        if diagonal < values[i + 1]:
+            values[i + 1] = diagonal
+            indices[i + 1] = i
+            self._base = i
+            self._tentative = self.finished = i + 1
+            return
+
+        # Row i loses to the tentative minimum of the last column, so by total monotonicity it
+        # loses on all tentative columns and the tentative minimum of column i+1 is final
+        if lookup(i, self._tentative) >= values[self._tentative]:
+            self.finished = i + 1
+            return
+
+        # Row i wins on the last tentative column, so the rows before it cannot supply a later
+        # minimum. The work of the dropped tentative minima is charged to the move of the base
+        self._base = i
+        self._tentative = self.finished = i + 1
+
+    def __repr__(self):
+        return f"OnlineMonotoneMinima(num_columns={self._num_columns}, finished={self.finished})"
+
+
+"""
+Computes E[j] = min_{i < j} E[i] + cost(i, j) for j = 1..num_nodes-1 in amortized O(1) lookups
+per node.
+
+Preconditions:
+    - cost(i, j) must be Monge on i < j
+
+Parameters:
+    num_nodes (int): Number of nodes.
+    cost (Callable[[int, int], float]): Function that returns the cost of the transition from i to j.
+    initial (float): The value E[0].
+
+Returns:
+    (List[float], List[int]): The values E[0..num_nodes-1] and the leftmost optimal predecessor
+                              of every node, None for node 0.
+"""
+
+def online_monge_minima(num_nodes, cost, initial=0):
+    def lookup(i, j):
+        return values[i] + cost(i, j)
+
+    online = OnlineMonotoneMinima(num_nodes, lookup, initial)
+    values = online.values
+    online.value(num_nodes - 1)
+    return online.values, online.indices
+
+
+if __name__ == "__main__":
+    # Example values: split a line of points into segments, each costing 4 plus its squared error
+    sequence = [1.0, 1.2, 0.9, 5.1, 4.8, 5.3, 5.0, 9.2, 8.7, 9.1]
+    segment_cost = 4
+
+    sums = [0.0]
+    squares = [0.0]
+    for x in sequence:
+        sums.append(sums[-1] + x)
+        squares.append(squares[-1] + x * x)
+
+    def cost(i, j):
+        return segment_cost + squares[j] - squares[i] - (sums[j] - sums[i]) ** 2 / (j - i)
+
+    values, indices = online_monge_minima(len(sequence) + 1, cost)
+
+    # Follow the predecessors back from the last node
+    boundaries = [len(sequence)]
+    while boundaries[-1] > 0:
+        boundaries.append(indices[boundaries[-1]])
+    boundaries.reverse()
+
+    print(f"Least penalized squared error: {values[-1]:.4f}")
+    print(f"Segments: {[sequence[i:j] for i, j in zip(boundaries, boundaries[1:])]}")
@@ -0,0 +1,219 @@
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+
+_lookup = None # lookup function installed in each worker process
+
+def _install_lookup(lookup_function):
+    global _lookup
+    _lookup = lookup_function
+
+# Reduce of one block of columns on the rows of a level, the top of the stack is compared
+# by its stored value so that every comparison costs one lookup
+def _reduce_block(lookup, rows, columns):
+    lookup = lookup or _lookup
+    num_rows = len(rows)
+    stack = []
+    stack_values = []
+    for j in columns:
+        while stack:
+            value = lookup(rows[len(stack) - 1], j)
+            if stack_values[-1] > value:
+                stack.pop()
+                stack_values.pop()
+            else:
+                break
+        if len(stack) < num_rows:
+            stack_values.append(lookup(rows[len(stack)], j))
+            stack.append(j)
+    return stack
+
+# Leftmost minimum of every (row, columns) window of a chunk
+def _search_windows(lookup, windows):
+    lookup = lookup or _lookup
+    results = []
+    for row, columns in windows:
+        min_value = lookup(row, columns[0])
+        min_offset = 0
+        for offset in range(1, len(columns)):
+            value = lookup(row, columns[offset])
+            if value < min_value:
+                min_value = value
+                min_offset = offset
+        results.append((min_offset, min_value))
+    return results
+
+"""
+Finds the column index of the minimum value in each row of a totally monotone matrix,
+spreading the lookups of every level over a pool of workers.
+
+The recursion is unrolled into levels as in `smawk_vectorized`. The reduce step of a level is
+split into blocks of at least twice as many columns as rows that are reduced independently,
+since a column that holds no leftmost row minimum within its block holds none in the whole
+matrix. A level too narrow for two such blocks is not reduced, as its reduce would be a serial
+pass. The odd-row searches of the interpolate step are independent and are cut into pieces of
+at most `chunk_size` lookups, which are grouped into `chunks_per_worker` tasks per worker, so
+that one wide window does not hold up the level. This makes more lookups than the serial
+engine, but all of them in parallel, and gives the same argmins and values as
+`smawk_with_lookup`.
+
+Threads suit lookups that release the GIL (I/O, NumPy, native code). Otherwise a process pool
+is used, which needs a picklable `lookup_function`: it is sent once to each worker of the
+pool created for the call, or with every task to a passed `executor`.
+
+Preconditions:
+    - `matrix` must be totally monotone
+
+Parameters:
+    num_rows (int): Number of rows in the matrix.
+    num_columns (int): Number of columns in the matrix.
+    lookup_function (Callable[[int, int], float]): Function that returns the value at (i, j).
+    max_workers (int, optional): Number of workers, defaults to the CPU count.
+    processes (bool): Use a process pool instead of a thread pool.
+    executor (concurrent.futures.Executor, optional): Pool to run the tasks on instead of a new one.
+    chunk_size (int): Largest number of lookups of a window piece, smaller levels run in the calling thread.
+    chunks_per_worker (int): Number of tasks per worker and phase.
+    return_values (bool): Also return the minimum value of each row.
+
+Returns:
+    List[int]: A list where the i-th entry is the column index
+                of the minimum element in row i.
+    If `return_values` is set, a tuple (minima, values) where values[i] is the
+    minimum of row i.
+"""
+
+def smawk_parallel(num_rows, num_columns, lookup_function, max_workers=None, processes=False, executor=None,
+                   chunk_size=256, chunks_per_worker=4, return_values=False):
+    if num_rows == 0 or num_columns == 0:
+        return None
+
+    max_workers = max_workers or getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+    owned = executor is None
+    if owned and processes:
+        executor = ProcessPoolExecutor(max_workers, initializer=_install_lookup, initargs=(lookup_function,))
+    elif owned:
+        executor = ThreadPoolExecutor(max_workers)
+    task_lookup = None if owned and processes else lookup_function # None: installed in the workers
+
+    try:
+        search = _WindowSearch(executor, task_lookup, lookup_function, chunk_size, max_workers * chunks_per_worker)
+        minima = [None] * num_rows # will store the column index of row minimum for each row
+        values = [None] * num_rows # will store the minimum value of each row
+
+        rows = range(num_rows)
+        columns = list(range(num_columns))
+        levels = [] # (rows, columns) of every interpolate level, outermost first
+
+        # Descend: reduce columns and halve the rows until a single row is left
+        while len(rows) > 1:
+            if len(columns) > len(rows):
+                columns = _reduce(executor, task_lookup, rows, columns, chunk_size, max_workers * chunks_per_worker)
+            levels.append((rows, columns))
+            rows = rows[1::2]
+
+        # Base case
+        (position, value), = search([(rows[0], columns, 0, len(columns) - 1)])
+        minima[rows[0]] = columns[position]
+        values[rows[0]] = value
+
+        # Ascend: interpolate the odd rows of each level in restricted areas
+        for rows, columns in reversed(levels):
+            windows = []
+            for p in range(0, len(rows), 2):
+                lower_bound = bisect_left(columns, minima[rows[p - 1]]) if p > 0 else 0
+                upper_bound = bisect_left(columns, minima[rows[p + 1]]) if p + 1 < len(rows) else len(columns) - 1
+                windows.append((rows[p], columns, lower_bound, upper_bound))
+
+            for (row, _, _, _), (position, value) in zip(windows, search(windows)):
+                minima[row] = columns[position]
+                values[row] = value
+
+        return (minima, values) if return_values else minima
+    finally:
+        if owned:
+            executor.shutdown()
+
+
+# Reduces the columns of a level in blocks of at least twice as many columns as rows on the
+# pool, which at least halves them. The surviving columns of all blocks are kept without a
+# final merge, since a stack merge would be a serial pass over all of them
+def _reduce(executor, task_lookup, rows, columns, chunk_size, max_tasks):
+    num_blocks = min(max_tasks, len(columns) // max(chunk_size, 2 * len(rows)))
+    if num_blocks < 2:
+        return columns
+
+    block_size = -(-len(columns) // num_blocks)
+    blocks = [columns[start:start + block_size] for start in range(0, len(columns), block_size)]
+    survivors = []
+    for block in executor.map(_reduce_block, [task_lookup] * len(blocks), [rows] * len(blocks), blocks):
+        survivors.extend(block)
+    return survivors
+
+
+# Leftmost minimum of many windows, each given as (row, columns, lower bound, upper bound)
+# and returned as (position in columns, value)
+class _WindowSearch:
+    def __init__(self, executor, task_lookup, lookup_function, chunk_size, max_tasks):
+        self.executor = executor
+        self.task_lookup = task_lookup
+        self.lookup_function = lookup_function
+        self.chunk_size = chunk_size
+        self.max_tasks = max_tasks
+
+    def __call__(self, windows):
+        # Cut the windows into pieces of at most chunk_size columns
+        pieces = [] # (window, first position, (row, columns of the piece))
+        for index, (row, columns, lower_bound, upper_bound) in enumerate(windows):
+            for start in range(lower_bound, upper_bound + 1, self.chunk_size):
+                stop = min(start + self.chunk_size, upper_bound + 1)
+                pieces.append((index, start, (row, columns[start:stop])))
+
+        total = sum(len(piece[2][1]) for piece in pieces)
+        if total <= self.chunk_size:
+            results = _search_windows(self.lookup_function, [piece[2] for piece in pieces])
+        else:
+            # Group consecutive pieces into tasks of similar size
+            task_size = max(self.chunk_size, -(-total // self.max_tasks))
+            tasks = [[]]
+            size = 0
+            for piece in pieces:
+                if size >= task_size:
+                    tasks.append([])
+                    size = 0
+                tasks[-1].append(piece[2])
+                size += len(piece[2][1])
+
+            results = []
+            for task_results in self.executor.map(_search_windows, [self.task_lookup] * len(tasks), tasks):
+                results.extend(task_results)
+
+        # Merge the pieces of each window, ties go to the earlier piece
+        merged = [None] * len(windows)
+        for (index, start, _), (offset, value) in zip(pieces, results):
+            if merged[index] is None or value < merged[index][1]:
+                merged[index] = (start + offset, value)
+        return merged
+
+
+if __name__ == "__main__":
+    import time
+    from smawk.smawk_with_lookup import smawk_with_lookup
+
+    # Example values: a Monge matrix whose lookups wait on an external cost model
+    num_rows, num_columns = 300, 400
+
+    def lookup(i, j):
+        time.sleep(0.0002)
+        return (i - j) ** 2 + 3 * j
+
+    start_time = time.perf_counter()
+    serial = smawk_with_lookup(num_rows, num_columns, lookup)
+    serial_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    parallel = smawk_parallel(num_rows, num_columns, lookup, max_workers=8, chunk_size=32)
+    parallel_time = time.perf_counter() - start_time
+
+    assert parallel == serial
+    print(f"Row minima of rows 0..9: {parallel[:10]}")
+    print(f"Serial: {serial_time:.2f}s, 8 threads: {parallel_time:.2f}s")
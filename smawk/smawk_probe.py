@@ -0,0 +1,168 @@
+from collections import Counter
+import time
+
+"""
+Collects statistics of `smawk` and `smawk_with_lookup` when passed as their `probe` argument.
+
+The search calls the probe once when a recursion level starts and once when it ends, nothing
+is added to the inner loops. While a probe is attached, the lookups of every level are
+counted by a wrapper around the level's lookup function (matrix reads for `smawk`).
+Comparisons are derived per phase: every reduce comparison reads two entries, the base case
+compares each column after the first, and an interpolated row compares every column of its
+window after the first.
+
+Parameters:
+    track_accesses (bool): Also count the accesses to every entry (i, j) of the top-level matrix.
+
+Attributes:
+    levels (List[dict]): One record per recursion level in order of completion, with the keys
+        depth, phase ("base", "reduce" or "interpolate"), num_rows, num_columns, lookups,
+        comparisons, seconds (wall time including sub-levels) and self_seconds.
+    accesses (Counter): Number of lookups of each (call, i, j), where call numbers the
+        top-level searches observed by this probe. Only filled if `track_accesses` is set.
+    calls (int): Number of top-level searches observed.
+"""
+
+class SmawkProbe:
+    def __init__(self, track_accesses=False):
+        self.track_accesses = track_accesses
+        self.levels = []
+        self.accesses = Counter()
+        self.calls = 0
+        self._stack = [] # [lookups, start time, time spent in sub-levels] of every open level
+
+    # Called at the start of every level, returns the state of the level
+    def enter(self, num_rows, num_columns):
+        if not self._stack:
+            self.calls += 1
+        level = [0, time.perf_counter(), 0.0]
+        self._stack.append(level)
+        return level
+
+    # Called at the end of every level
+    def exit(self, level, phase, num_rows, num_columns, comparisons):
+        seconds = time.perf_counter() - level[1]
+        self._stack.pop()
+        if self._stack:
+            self._stack[-1][2] += seconds
+
+        self.levels.append({
+            "depth": len(self._stack),
+            "phase": phase,
+            "num_rows": num_rows,
+            "num_columns": num_columns,
+            "lookups": level[0],
+            "comparisons": comparisons,
+            "seconds": seconds,
+            "self_seconds": seconds - level[2],
+        })
+
+    # Counts the lookups of a level
+    def counted(self, lookup_function, level):
+        def counting_lookup(i, j):
+            level[0] += 1
+            return lookup_function(i, j)
+        return counting_lookup
+
+    # Counts the reads of a level from the rows of an explicit matrix
+    def counted_rows(self, matrix, level):
+        return [_CountingRow(row, level) for row in matrix]
+
+    # Comparisons of an interpolate step, so that the searches need not import this module
+    def interpolate_comparisons(self, minima, num_columns):
+        return interpolate_comparisons(minima, num_columns)
+
+    # Records the accesses to the top-level matrix, sub-levels look up through it
+    def tracked(self, lookup_function):
+        if not self.track_accesses or len(self._stack) != 1:
+            return lookup_function
+
+        accesses = self.accesses
+        call = self.calls - 1
+
+        def tracking_lookup(i, j):
+            accesses[(call, i, j)] += 1
+            return lookup_function(i, j)
+        return tracking_lookup
+
+    @property
+    def lookups(self):
+        return sum(level["lookups"] for level in self.levels)
+
+    # Comparisons per phase
+    @property
+    def comparisons(self):
+        totals = {"reduce": 0, "interpolate": 0, "base": 0}
+        for level in self.levels:
+            totals[level["phase"]] += level["comparisons"]
+        return totals
+
+    @property
+    def max_depth(self):
+        return max((level["depth"] for level in self.levels), default=0)
+
+    def __repr__(self):
+        return f"SmawkProbe(calls={self.calls}, lookups={self.lookups}, comparisons={self.comparisons}, max_depth={self.max_depth})"
+
+
+class _CountingRow:
+    __slots__ = ("row", "level")
+
+    def __init__(self, row, level):
+        self.row = row
+        self.level = level
+
+    def __getitem__(self, j):
+        self.level[0] += 1
+        return self.row[j]
+
+    def __len__(self):
+        return len(self.row)
+
+
+"""
+Counts the comparisons made by the odd rows of an interpolate step, where each row searches the
+columns between the minima of its neighbours.
+
+Parameters:
+    minima (List[int]): Column index of the minimum of each row.
+    num_columns (int): Number of columns in the matrix.
+
+Returns:
+    int: The number of comparisons.
+"""
+
+def interpolate_comparisons(minima, num_columns):
+    num_rows = len(minima)
+    comparisons = 0
+    for row in range(0, num_rows, 2):
+        lower_bound = minima[row - 1] if row > 0 else 0
+        upper_bound = minima[row + 1] if row + 1 < num_rows else num_columns - 1
+        comparisons += upper_bound - lower_bound
+    return comparisons
+
+
+if __name__ == "__main__":
+    from smawk.smawk_with_lookup import smawk_with_lookup
+
+    # Example values
+    matrix = [
+        [25, 21, 13, 10, 20, 13, 19, 35, 37, 41, 58, 66, 82, 99, 124, 133, 156, 178],
+        [42, 35, 26, 20, 29, 21, 25, 37, 36, 39, 56, 64, 76, 91, 116, 125, 146, 164],
+        [57, 48, 35, 28, 33, 24, 28, 40, 37, 37, 54, 61, 72, 83, 107, 113, 131, 146],
+        [78, 65, 51, 42, 44, 35, 38, 48, 42, 42, 55, 61, 70, 80, 100, 106, 120, 135],
+        [90, 76, 58, 48, 49, 39, 42, 48, 39, 35, 47, 51, 56, 63, 80, 86, 97, 110],
+        [103, 85, 67, 56, 55, 44, 44, 49, 39, 33, 41, 44, 49, 56, 71, 75, 84, 96],
+        [123, 105, 86, 75, 73, 59, 57, 62, 51, 44, 50, 52, 55, 59, 72, 74, 80, 92],
+        [142, 123, 100, 86, 82, 65, 61, 62, 50, 43, 47, 45, 46, 46, 58, 59, 65, 73],
+        [151, 130, 104, 88, 80, 59, 52, 49, 37, 29, 29, 24, 23, 20, 28, 25, 31, 39]
+    ]
+
+    probe = SmawkProbe(track_accesses=True)
+    smawk_with_lookup(len(matrix), len(matrix[0]), lambda i, j: matrix[i][j], probe=probe)
+
+    print(probe)
+    for level in reversed(probe.levels):
+        print(f"depth {level['depth']}: {level['phase']:>11} on {level['num_rows']:2} x {level['num_columns']:2}, "
+              f"{level['lookups']:3} lookups, {level['comparisons']:3} comparisons")
+    print(f"Distinct entries accessed: {len(probe.accesses)} of {len(matrix) * len(matrix[0])}")
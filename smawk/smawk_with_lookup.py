@@ -1,3 +1,5 @@
+from smawk.lookup_cache import LookupCache
+
 """
 Finds the column index of the minimum value in each row of a totally monotone matrix.
 
@@ -8,46 +10,66 @@ Parameters:
     num_rows (int): Number of rows in the matrix.
     num_columns (int): Number of columns in the matrix.
     lookup_function (Callable[[int, int], float]): Function that returns the value at (i, j).
+    cache (LookupCache, optional): Memoizes the lookups of each recursion level.
+    return_values (bool): Also return the minimum value of each row.
+    probe (SmawkProbe, optional): Collects lookups, comparisons and timings of every recursion level.
 
 Returns:
     List[int]: A list where the i-th entry is the column index 
                 of the minimum element in row i.
+    If `return_values` is set, a tuple (minima, values) where values[i] is the
+    minimum of row i, taken from the lookups made during the search.
 """
 
-def smawk_with_lookup(num_rows, num_columns, lookup_function):
+def smawk_with_lookup(num_rows, num_columns, lookup_function, cache=None, return_values=False, probe=None):
     if num_rows == 0 or num_columns == 0:
         return None
+
+    if probe is not None:
+        level = probe.enter(num_rows, num_columns)
+        lookup_function = probe.tracked(lookup_function)
+
+    # Memoize the accesses of this level, sub-levels get a scope of their own
+    lookup = lookup_function if cache is None else cache.scope(lookup_function, num_rows + num_columns)
+    if probe is not None:
+        lookup = probe.counted(lookup, level)
     
     minima = [None] * num_rows # will store the column index of row minimum for each row
+    values = [None] * num_rows # will store the minimum value of each row
     
     # Base case
     if num_rows == 1:
-        min_value = lookup_function(0, 0)
+        min_value = lookup(0, 0)
         min_column = 0
         for j in range(1, num_columns):
-            if lookup_function(0, j) < min_value:
-                min_value = lookup_function(0, j)
+            value = lookup(0, j)
+            if value < min_value:
+                min_value = value
                 min_column = j
         minima[0] = min_column
-        return minima
+        values[0] = min_value
+        if probe is not None:
+            probe.exit(level, "base", num_rows, num_columns, num_columns - 1)
+        return (minima, values) if return_values else minima
     
     # Reuce
     if num_columns > num_rows:
         reduced_columns = []
         stack = []
         for j in range(num_columns):
-            while stack and lookup_function(len(stack) - 1, stack[-1]) > lookup_function(len(stack) - 1, j):
+            while stack and lookup(len(stack) - 1, stack[-1]) > lookup(len(stack) - 1, j):
                 stack.pop()
             if len(stack) < num_rows:
                 stack.append(j)
         reduced_columns = stack
+        phase = "reduce"
         
         # Define reduced lookup on reduced column set
         def reduced_lookup(i, j):
             return lookup_function(i, reduced_columns[j])
         
         # Recursive SMAWK Call on reduced matrix
-        reduced_minima = smawk_with_lookup(num_rows, len(reduced_columns), reduced_lookup)
+        reduced_minima, values = smawk_with_lookup(num_rows, len(reduced_columns), reduced_lookup, cache, True, probe)
         
         # Map reduced minima back to original column indices
         for i in range(num_rows):
@@ -63,27 +85,38 @@ def smawk_with_lookup(num_rows, num_columns, lookup_function):
             return lookup_function(even_rows[i], j)
         
         # Recursive SMAWK Call on even rows
-        reduced_minima = smawk_with_lookup(len(even_rows), num_columns, even_lookup)
+        reduced_minima, reduced_values = smawk_with_lookup(len(even_rows), num_columns, even_lookup, cache, True, probe)
         
         # Map reduced minima back to original column indices
         for idx, row in enumerate(even_rows):
             minima[row] = reduced_minima[idx]
+            values[row] = reduced_values[idx]
         
         # Compute minima for odd rows vial linear search in restricted area
         for row in odd_rows:
             lower_bound = minima[row - 1] if row > 0 else 0
             upper_bound = minima[row + 1] if row + 1 < num_rows else num_columns - 1
-            min_value = lookup_function(row, lower_bound)
+            min_value = lookup(row, lower_bound)
             min_column = lower_bound
             for j in range(lower_bound + 1, upper_bound + 1):
-                if lookup_function(row, j) < min_value:
-                    min_value = lookup_function(row, j)
+                value = lookup(row, j)
+                if value < min_value:
+                    min_value = value
                     min_column = j
             minima[row] = min_column
+            values[row] = min_value
+        phase = "interpolate"
+
+    if probe is not None:
+        # Each reduce comparison reads two entries
+        comparisons = level[0] // 2 if phase == "reduce" else probe.interpolate_comparisons(minima, num_columns)
+        probe.exit(level, phase, num_rows, num_columns, comparisons)
             
-    return minima
+    return (minima, values) if return_values else minima
 
 if __name__ == "__main__":
+    from smawk.smawk_probe import SmawkProbe
+
     # Example values
     matrix = [
         [25, 21, 13, 10, 20, 13, 19, 35, 37, 41, 58, 66, 82, 99, 124, 133, 156, 178],
@@ -108,3 +141,13 @@ if __name__ == "__main__":
     for i, col in enumerate(minima_indices):
         val = matrix[i][col]
         print(f"Row {i:2}: min at column {col:2} (value = {val})")
+
+    # Same search with memoized lookups
+    cache = LookupCache()
+    assert smawk_with_lookup(num_rows, num_columns, lookup, cache) == minima_indices
+    print(f"Cached lookups: {cache.hits} hits, {cache.misses} misses")
+
+    # Same search with statistics per recursion level
+    probe = SmawkProbe()
+    assert smawk_with_lookup(num_rows, num_columns, lookup, probe=probe) == minima_indices
+    print(probe)